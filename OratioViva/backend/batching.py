@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import time
+from threading import Condition
+from typing import Callable, Generic, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class _Slot(Generic[T, R]):
+    __slots__ = ("item", "result", "error", "done")
+
+    def __init__(self, item: T) -> None:
+        self.item = item
+        self.result: Optional[R] = None
+        self.error: Optional[BaseException] = None
+        self.done = False
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+    Group concurrent blocking calls into batches for ``fn(items) -> results``.
+
+    The first caller to arrive becomes the leader: it waits up to ``window`` seconds
+    (or until ``max_batch`` items are queued), runs ``fn`` on the batch in its own
+    thread and hands each caller its result. ``fn`` never runs concurrently with
+    itself, so it may use a shared model without extra locking.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[[List[T]], Sequence[R]],
+        max_batch: int = 8,
+        window: float = 0.02,
+    ) -> None:
+        self.fn = fn
+        self.max_batch = max(1, max_batch)
+        self.window = window
+        self._queue: List[_Slot[T, R]] = []
+        self._cond = Condition()
+        self._leading = False
+
+    def submit(self, item: T) -> R:
+        slot: _Slot[T, R] = _Slot(item)
+        with self._cond:
+            self._queue.append(slot)
+            self._cond.notify_all()
+            while not slot.done:
+                if self._leading:
+                    self._cond.wait()
+                    continue
+                self._leading = True
+                try:
+                    self._run_batch()
+                finally:
+                    self._leading = False
+                    self._cond.notify_all()
+        if slot.error is not None:
+            raise slot.error
+        return slot.result  # type: ignore[return-value]
+
+    def _run_batch(self) -> None:
+        # Called with the condition held; released while waiting and while fn runs.
+        deadline = time.monotonic() + self.window
+        while len(self._queue) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self._cond.wait(remaining)
+        batch = self._queue[: self.max_batch]
+        del self._queue[: self.max_batch]
+
+        self._cond.release()
+        try:
+            results = list(self.fn([slot.item for slot in batch]))
+            if len(results) != len(batch):
+                raise RuntimeError(f"Batch function returned {len(results)} results for {len(batch)} items")
+            error: Optional[BaseException] = None
+        except BaseException as exc:  # noqa: BLE001 - forwarded to every caller
+            results, error = [], exc
+        finally:
+            self._cond.acquire()
+
+        for index, slot in enumerate(batch):
+            if error is not None:
+                slot.error = error
+            else:
+                slot.result = results[index]
+            slot.done = True
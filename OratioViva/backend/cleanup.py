@@ -1,10 +1,60 @@
 from __future__ import annotations
 
-import json
 import os
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List
+from typing import Collection, Dict, List, Optional, Set
+
+from backend.jsonio import read_jsonl_tail, write_jsonl
+
+
+def scan_files(directory: Path) -> Set[str]:
+    """Return the paths of regular files in ``directory`` with a single scan."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.path for entry in entries if entry.is_file()}
+    except OSError:
+        return set()
+
+
+def file_exists(path: str, known: Collection[str]) -> bool:
+    """Check ``path`` against a scan result, falling back to stat() on a miss."""
+    return path in known or os.path.exists(path)
+
+
+def _remove_older_than(
+    directory: Path,
+    cutoff_ts: float,
+    *,
+    suffix: str = "",
+    kept: Optional[Set[str]] = None,
+) -> int:
+    """
+    Unlink files in ``directory`` ending with ``suffix`` last modified before ``cutoff_ts``.
+
+    Paths left in place (other names, subdirectories, fresh files) are added to ``kept``.
+    """
+    removed = 0
+    try:
+        # DirEntry.stat() reuses data gathered during the scan where the OS allows it.
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if (
+                        entry.name.endswith(suffix)
+                        and entry.is_file()
+                        and entry.stat().st_mtime < cutoff_ts
+                    ):
+                        os.unlink(entry.path)
+                        removed += 1
+                        continue
+                except OSError:
+                    pass
+                if kept is not None:
+                    kept.add(entry.path)
+    except OSError:
+        pass
+    return removed
 
 
 def cleanup_outputs(
@@ -15,43 +65,40 @@ def cleanup_outputs(
     max_history: int = 200,
 ) -> Dict[str, int]:
     """Remove old audio files and trim history."""
-    now = datetime.now(timezone.utc)
-    cutoff = now - timedelta(hours=max_age_hours)
+    # Compare raw POSIX timestamps so the audio scan never builds datetimes.
+    cutoff_ts = (datetime.now(timezone.utc) - timedelta(hours=max_age_hours)).timestamp()
 
     removed_files = 0
     removed_history = 0
 
-    if audio_dir.exists():
-        for wav in audio_dir.glob("*.wav"):
-            mtime = datetime.fromtimestamp(wav.stat().st_mtime, tz=timezone.utc)
-            if mtime < cutoff:
-                try:
-                    wav.unlink()
-                    removed_files += 1
-                except OSError:
-                    continue
+    # Paths of the files left in audio_dir, so history entries can be checked
+    # without one stat() per entry.
+    existing: Set[str] = set()
+    removed_files += _remove_older_than(audio_dir, cutoff_ts, suffix=".wav", kept=existing)
 
-    history: List[dict] = []
-    if history_path.exists():
-        try:
-            history = json.loads(history_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            history = []
+    # Cached model outputs and speaker x-vectors (backend.tts) age out on the same
+    # schedule; both are touched when reused.
+    removed_files += _remove_older_than(audio_dir / "cache", cutoff_ts)
+    removed_files += _remove_older_than(audio_dir / "cache" / "xvectors", cutoff_ts)
+
+    # History is stored as JSON Lines, oldest first; work on it newest first.
+    history: List[dict] = read_jsonl_tail(history_path)
 
     filtered = []
     for entry in history:
         audio_path = entry.get("audio_path")
-        if audio_path and not Path(audio_path).exists():
+        if audio_path and not file_exists(audio_path, existing):
             removed_history += 1
             continue
-        created_at = entry.get("created_at")
         try:
-            dt = datetime.fromisoformat(created_at)
+            created = datetime.fromisoformat(entry.get("created_at"))
         except Exception:
-            dt = now
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        if dt < cutoff:
+            # Unparseable dates count as fresh.
+            filtered.append(entry)
+            continue
+        if created.tzinfo is None:
+            created = created.replace(tzinfo=timezone.utc)
+        if created.timestamp() < cutoff_ts:
             removed_history += 1
             continue
         filtered.append(entry)
@@ -60,8 +107,7 @@ def cleanup_outputs(
         removed_history += len(filtered) - max_history
         filtered = filtered[:max_history]
 
-    history_path.parent.mkdir(parents=True, exist_ok=True)
-    history_path.write_text(json.dumps(filtered, indent=2, ensure_ascii=False), encoding="utf-8")
+    write_jsonl(history_path, reversed(filtered))
 
     return {
         "removed_files": removed_files,
@@ -13,7 +13,7 @@ import socket
 import threading
 import time
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
 
 import httpx
 import uvicorn
@@ -54,42 +54,70 @@ DEFAULT_PORT = int(os.getenv("ORATIO_PORT", "8000"))
 POLL_TIMEOUT = float(os.getenv("ORATIO_APP_WAIT", "12"))
 
 
-def find_available_port(host: str, preferred: int) -> int:
-    """Try the preferred port first, then fall back to any free port."""
-    candidates = [preferred, 0]
-    for candidate in candidates:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            try:
-                sock.bind((host, candidate))
-                return sock.getsockname()[1]
-            except OSError:
-                continue
-    return preferred
-
+def bind_server_socket(host: str, preferred: int) -> socket.socket:
+    """
+    Bind and listen on the preferred port, falling back to any free port.
 
-def start_server(host: str, port: int) -> Tuple[uvicorn.Server, threading.Thread]:
+    The socket is handed to uvicorn as-is, so the port cannot be taken between
+    the probe and the server start.
+    """
+    last_error: Optional[OSError] = None
+    for candidate in (preferred, 0):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            if hasattr(socket, "SO_EXCLUSIVEADDRUSE"):
+                # Windows: SO_REUSEADDR would let us bind over a live listener.
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+            else:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind((host, candidate))
+            sock.listen(2048)
+            return sock
+        except OSError as exc:
+            sock.close()
+            last_error = exc
+    assert last_error is not None
+    raise last_error
+
+
+def start_server(
+    host: str, port: int, sock: Optional[socket.socket] = None
+) -> Tuple[uvicorn.Server, threading.Thread]:
     """Launch uvicorn in a background thread and return the server + thread."""
     config = uvicorn.Config(app, host=host, port=port, log_level="info")
     server = uvicorn.Server(config=config)
-    thread = threading.Thread(target=server.run, daemon=True)
+    kwargs = {"sockets": [sock]} if sock is not None else {}
+    thread = threading.Thread(target=server.run, kwargs=kwargs, daemon=True)
     thread.start()
     return server, thread
 
 
 def wait_for_ready(host: str, port: int, timeout: float = POLL_TIMEOUT) -> bool:
-    """Poll /health until the API answers or timeout expires."""
+    """
+    Wait until the API answers or timeout expires.
+
+    Probe the port with plain TCP connects (exponential backoff from 20ms to
+    200ms), then confirm once with GET /health.
+    """
     url = f"http://{host}:{port}/health"
-    deadline = time.time() + timeout
+    deadline = time.monotonic() + timeout
+    delay = 0.02
     with httpx.Client(timeout=3) as client:
-        while time.time() < deadline:
+        while time.monotonic() < deadline:
+            try:
+                with socket.create_connection((host, port), timeout=0.1):
+                    pass
+            except OSError:
+                time.sleep(delay)
+                delay = min(delay * 2, 0.2)
+                continue
             try:
                 resp = client.get(url)
                 if resp.status_code == 200:
                     return True
             except httpx.HTTPError:
                 pass
-            time.sleep(0.4)
+            time.sleep(delay)
     return False
 
 
@@ -134,11 +162,12 @@ def open_desktop_window(host: str, port: int, server: uvicorn.Server) -> bool:
 
 def main() -> None:
     host = DEFAULT_HOST
-    port = find_available_port(host, DEFAULT_PORT)
+    sock = bind_server_socket(host, DEFAULT_PORT)
+    port = sock.getsockname()[1]
     print(f"[oratioviva] Demarrage du serveur local sur {host}:{port}")
     print(f"[oratioviva] Donnees et sorties: {DATA_DIR}")
 
-    server, thread = start_server(host, port)
+    server, thread = start_server(host, port, sock)
     ready = wait_for_ready(host, port)
     if not ready:
         print("[oratioviva] Le serveur ne repond pas (timeout).")
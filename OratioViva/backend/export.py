@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import io
+import zipfile
+from pathlib import Path
+from typing import Iterable, Iterator, List
+
+CHUNK_SIZE = 1 << 20
+
+
+class _ChunkSink(io.RawIOBase):
+    """Unseekable write target that hands buffered zip output back to the caller."""
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:  # type: ignore[override]
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_zip(files: Iterable[Path], chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yield a ZIP archive of ``files`` chunk by chunk.
+
+    Entries are stored uncompressed: WAV data barely deflates, and streaming keeps
+    at most one chunk of audio in memory instead of the whole archive.
+    """
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_STORED) as archive:
+        for path in files:
+            info = zipfile.ZipInfo.from_file(path, arcname=Path(path).name)
+            with open(path, "rb") as src, archive.open(info, "w") as dest:
+                while chunk := src.read(chunk_size):
+                    dest.write(chunk)
+                    if data := sink.drain():
+                        yield data
+            if data := sink.drain():
+                yield data
+    if data := sink.drain():
+        yield data
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import atexit
+from collections import deque
+from itertools import islice
+from pathlib import Path
+from threading import RLock, Timer
+from typing import Callable, Deque, Dict, Iterable, List, Optional, TypeVar
+
+from backend.jsonio import append_jsonl, read_jsonl_tail, write_jsonl
+
+T = TypeVar("T")
+
+
+class HistoryStore:
+    """
+    In-memory history (newest first) backed by a JSON Lines file.
+
+    Appends are buffered and flushed after ``flush_delay`` seconds (and at exit),
+    so the request path never touches the disk. Deletions mark the file for a
+    full rewrite on the next flush.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_items: int = 200,
+        flush_delay: float = 1.0,
+    ) -> None:
+        self.path = path
+        self.max_items = max_items
+        self.flush_delay = flush_delay
+        self._entries: Deque[dict] = deque(maxlen=max_items)
+        self._by_job_id: Dict[str, dict] = {}
+        self._pending: List[dict] = []
+        self._rewrite = False
+        self._appended = 0
+        self._lock = RLock()
+        self._timer: Optional[Timer] = None
+        # While run_maintenance() lets another writer own the file: flushes are held
+        # back and removals remembered so the reload does not resurrect them.
+        self._maintaining = False
+        self._removed_during: set = set()
+        self._load()
+        atexit.register(self.flush)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def list(self, limit: Optional[int] = None) -> List[dict]:
+        with self._lock:
+            if limit is None:
+                return list(self._entries)
+            return list(islice(self._entries, max(limit, 0)))
+
+    def get_many(self, job_ids: Iterable[str]) -> List[dict]:
+        """Look up entries by job_id (in the given order), skipping unknown ids."""
+        with self._lock:
+            return [
+                self._by_job_id[job_id]
+                for job_id in dict.fromkeys(job_ids)
+                if job_id in self._by_job_id
+            ]
+
+    def append(self, entry: dict) -> None:
+        with self._lock:
+            if len(self._entries) == self.max_items:
+                self._unindex(self._entries[-1])  # about to fall off the deque
+            self._entries.appendleft(entry)
+            self._index(entry)
+            self._pending.append(entry)
+            self._schedule_flush()
+
+    def remove(self, job_id: str) -> Optional[dict]:
+        removed = self.remove_many([job_id])
+        return removed[0] if removed else None
+
+    def remove_many(self, job_ids: Iterable[str]) -> List[dict]:
+        """Drop every entry whose job_id is listed; returns the removed entries."""
+        with self._lock:
+            wanted = {job_id for job_id in job_ids if job_id in self._by_job_id}
+            if not wanted:
+                return []
+            removed: List[dict] = []
+            kept: List[dict] = []
+            for entry in self._entries:
+                (removed if entry.get("job_id") in wanted else kept).append(entry)
+            for entry in removed:
+                self._unindex(entry)
+            if self._maintaining:
+                self._removed_during.update(wanted)
+            self._entries.clear()
+            self._entries.extend(kept)
+            self._rewrite = True
+            self._schedule_flush()
+            return removed
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._maintaining:
+                return  # run_maintenance() flushes once fn is done with the file
+            if not self.path:
+                self._pending.clear()
+                return
+            # Rewrite when entries were removed, or to compact the file once the
+            # appended lines exceed what the store keeps in memory.
+            if self._rewrite or self._appended + len(self._pending) > self.max_items:
+                write_jsonl(self.path, reversed(self._entries))
+                self._appended = 0
+            elif self._pending:
+                append_jsonl(self.path, self._pending)
+                self._appended += len(self._pending)
+            self._pending.clear()
+            self._rewrite = False
+
+    def run_maintenance(self, fn: Callable[[], T]) -> T:
+        """
+        Flush, let ``fn`` rewrite the file on disk, then reload from it.
+
+        ``fn`` runs without the lock, so the store keeps serving reads, appends and
+        removals meanwhile; those are merged into the reloaded entries afterwards.
+        """
+        with self._lock:
+            self.flush()
+            self._maintaining = True
+            self._removed_during = set()
+        try:
+            return fn()
+        finally:
+            with self._lock:
+                self._maintaining = False
+                removed, self._removed_during = self._removed_during, set()
+                appended = [e for e in self._pending if e.get("job_id") not in removed]
+                self._entries.clear()
+                self._by_job_id.clear()
+                self._load()
+                for entry in appended:  # oldest first, still pending for the file
+                    if len(self._entries) == self.max_items:
+                        self._unindex(self._entries[-1])
+                    self._entries.appendleft(entry)
+                    self._index(entry)
+                self._pending = appended
+                self.remove_many(removed)  # still in the file if fn read it first
+                if self._pending or self._rewrite:
+                    self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self.flush_delay <= 0:
+            self.flush()
+            return
+        if self._timer is None:
+            self._timer = Timer(self.flush_delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _load(self) -> None:
+        self._appended = 0
+        if not self.path:
+            return
+        self._entries.extend(read_jsonl_tail(self.path, limit=self.max_items))
+        # Iterate oldest first so the newest entry wins on duplicate job_ids.
+        for entry in reversed(self._entries):
+            self._index(entry)
+
+    def _index(self, entry: dict) -> None:
+        job_id = entry.get("job_id")
+        if job_id is not None:
+            self._by_job_id[job_id] = entry
+
+    def _unindex(self, entry: dict) -> None:
+        job_id = entry.get("job_id")
+        if self._by_job_id.get(job_id) is entry:
+            del self._by_job_id[job_id]
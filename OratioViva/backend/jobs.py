@@ -1,19 +1,25 @@
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
+import atexit
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from threading import Lock
-from typing import Dict, List, Optional
+from threading import RLock, Timer
+from typing import Any, Dict, Iterable, List, Optional
 
+from backend.jsonio import dumps, read_json, write_json
 
-@dataclass
+
+@dataclass(slots=True)
 class JobStatus:
     job_id: str
     status: str
-    created_at: datetime
-    updated_at: datetime
+    # Epoch seconds; converted to ISO-8601 only when the job is encoded.
+    created_at: float
+    updated_at: float
     audio_url: Optional[str] = None
     duration_seconds: Optional[float] = None
     model: Optional[str] = None
@@ -21,21 +27,60 @@ class JobStatus:
     source: Optional[str] = None
     error: Optional[str] = None
 
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["created_at"] = _isoformat(self.created_at)
+        data["updated_at"] = _isoformat(self.updated_at)
+        return data
+
+
+def _isoformat(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+def _parse_timestamp(value: Any) -> float:
+    if isinstance(value, (int, float)):
+        return float(value)
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
 
 class JobStore:
-    def __init__(self, path: Optional[Path] = None, max_items: int = 200) -> None:
-        self._jobs: Dict[str, JobStatus] = {}
-        self._lock = Lock()
+    """
+    In-memory job registry persisted to JSON.
+
+    Jobs are kept ordered by ``updated_at`` (oldest first) so saving never sorts.
+    Mutations only mark the store dirty; a timer writes the file ``flush_delay``
+    seconds later (and at exit), coalescing the several updates of one request.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_items: int = 200,
+        flush_delay: float = 0.5,
+    ) -> None:
+        self._jobs: OrderedDict[str, JobStatus] = OrderedDict()
+        # Encoded API payloads, dropped whenever the job changes.
+        self._payloads: Dict[str, bytes] = {}
+        self._lock = RLock()
+        self._timer: Optional[Timer] = None
+        self._dirty = False
         self.path = path
         self.max_items = max_items
+        self.flush_delay = flush_delay
         self._load()
+        atexit.register(self.flush)
 
     def create(self, job_id: str, status: str = "queued") -> JobStatus:
-        now = datetime.now(timezone.utc)
+        now = time.time()
         job = JobStatus(job_id=job_id, status=status, created_at=now, updated_at=now)
         with self._lock:
             self._jobs[job_id] = job
-            self._save()
+            self._jobs.move_to_end(job_id)
+            self._mark_dirty()
         return job
 
     def update(self, job_id: str, **fields) -> JobStatus:
@@ -43,73 +88,112 @@ class JobStore:
             job = self._jobs.get(job_id)
             if job is None:
                 raise KeyError(f"Unknown job_id: {job_id}")
-            data = job.__dict__.copy()
-            data.update(fields)
-            data["updated_at"] = datetime.now(timezone.utc)
-            job = JobStatus(**data)
-            self._jobs[job_id] = job
-            self._save()
+            for key, value in fields.items():
+                setattr(job, key, value)
+            job.updated_at = time.time()
+            self._payloads.pop(job_id, None)
+            self._jobs.move_to_end(job_id)
+            self._mark_dirty()
             return job
 
     def get(self, job_id: str) -> Optional[JobStatus]:
         with self._lock:
             return self._jobs.get(job_id)
 
+    def get_json(self, job_id: str) -> Optional[bytes]:
+        """Return the job encoded as JSON, reusing the last encoding if unchanged."""
+        with self._lock:
+            payload = self._payloads.get(job_id)
+            if payload is None:
+                job = self._jobs.get(job_id)
+                if job is None:
+                    return None
+                payload = self._payloads[job_id] = dumps(job.to_dict())
+            return payload
+
+    def list_json(self, limit: int = 50) -> bytes:
+        """Encode the newest jobs as a JSON array from cached per-job payloads."""
+        with self._lock:
+            job_ids = list(islice(reversed(self._jobs), max(limit, 0)))
+            items = [self.get_json(job_id) or b"null" for job_id in job_ids]
+            return b"[" + b",".join(items) + b"]"
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._jobs)
+
     def list(self, limit: int = 50) -> List[JobStatus]:
+        # Jobs are already kept in update order: take the newest without sorting.
         with self._lock:
-            jobs = sorted(self._jobs.values(), key=lambda j: j.updated_at, reverse=True)
-            return jobs[:limit]
+            return list(islice(reversed(self._jobs.values()), max(limit, 0)))
 
     def _load(self) -> None:
-        if not self.path or not self.path.exists():
-            return
-        try:
-            data = json.loads(self.path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
+        if not self.path:
             return
-        for item in data:
-            job = self._deserialize(item)
-            if job:
-                self._jobs[job.job_id] = job
+        data = read_json(self.path, default=[])
+        jobs = [job for job in map(self._deserialize, data) if job]
+        for job in sorted(jobs, key=lambda j: j.updated_at):
+            self._jobs[job.job_id] = job
 
     def delete(self, job_id: str) -> bool:
         with self._lock:
             if job_id not in self._jobs:
                 return False
             self._jobs.pop(job_id, None)
-            self._save()
+            self._payloads.pop(job_id, None)
+            self._mark_dirty()
             return True
 
+    def delete_many(self, job_ids: Iterable[str]) -> int:
+        with self._lock:
+            deleted = 0
+            for job_id in set(job_ids):
+                if self._jobs.pop(job_id, None) is not None:
+                    self._payloads.pop(job_id, None)
+                    deleted += 1
+            if deleted:
+                self._mark_dirty()
+            return deleted
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._dirty:
+                self._save()
+                self._dirty = False
+
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+        if self.flush_delay <= 0:
+            self.flush()
+            return
+        if self._timer is None:
+            self._timer = Timer(self.flush_delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
     def _save(self) -> None:
         if not self.path:
             return
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        jobs = sorted(self._jobs.values(), key=lambda j: j.updated_at, reverse=True)
-        jobs = jobs[: self.max_items]
+        jobs = islice(reversed(self._jobs.values()), self.max_items)
         payload = [self._serialize(job) for job in jobs]
-        self.path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+        write_json(self.path, payload)
 
     @staticmethod
     def _serialize(job: JobStatus) -> dict:
-        data = job.__dict__.copy()
-        data["created_at"] = job.created_at.isoformat()
-        data["updated_at"] = job.updated_at.isoformat()
-        return data
+        # Keep ISO strings on disk so the file stays readable and compatible.
+        return job.to_dict()
 
     @staticmethod
     def _deserialize(data: dict) -> Optional[JobStatus]:
         try:
-            created = datetime.fromisoformat(data["created_at"])
-            updated = datetime.fromisoformat(data["updated_at"])
-            if created.tzinfo is None:
-                created = created.replace(tzinfo=timezone.utc)
-            if updated.tzinfo is None:
-                updated = updated.replace(tzinfo=timezone.utc)
             return JobStatus(
                 job_id=data["job_id"],
                 status=data["status"],
-                created_at=created,
-                updated_at=updated,
+                created_at=_parse_timestamp(data["created_at"]),
+                updated_at=_parse_timestamp(data["updated_at"]),
                 audio_url=data.get("audio_url"),
                 duration_seconds=data.get("duration_seconds"),
                 model=data.get("model"),
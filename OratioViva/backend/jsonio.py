@@ -0,0 +1,99 @@
+"""JSON helpers backed by orjson when available, stdlib json otherwise."""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable, List, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None  # type: ignore[assignment]
+
+JSONDecodeError = json.JSONDecodeError  # orjson.JSONDecodeError subclasses it
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(value: Any, *, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 bytes; datetimes are written as ISO-8601 strings."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(value, option=option)
+    return json.dumps(
+        value,
+        indent=2 if indent else None,
+        ensure_ascii=False,
+        default=_default,
+    ).encode("utf-8")
+
+
+def read_json(path: Path, default: Any = None) -> Any:
+    """Load a JSON file, returning ``default`` when missing or corrupted."""
+    try:
+        return loads(path.read_bytes())
+    except (FileNotFoundError, JSONDecodeError):
+        return default
+
+
+def write_json(path: Path, value: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(dumps(value, indent=True))
+
+
+def append_jsonl(path: Path, records: Iterable[Any]) -> None:
+    """Append records, one per line (JSON Lines), with a single write."""
+    payload = b"".join(dumps(record) + b"\n" for record in records)
+    if payload:
+        with path.open("ab") as fh:
+            fh.write(payload)
+
+
+def write_jsonl(path: Path, records: Iterable[Any]) -> None:
+    """Rewrite a JSON Lines file, records in file order (oldest first)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"".join(dumps(record) + b"\n" for record in records))
+
+
+def read_jsonl_tail(path: Path, limit: Optional[int] = None) -> List[Any]:
+    """
+    Read records from the end of a JSON Lines file, newest first.
+
+    Only the last ``limit`` lines are decoded; torn or corrupted lines are skipped.
+    """
+    records: List[Any] = []
+    try:
+        with path.open("rb") as fh:
+            if os.fstat(fh.fileno()).st_size == 0:
+                return records
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                pos = len(mm)
+                while pos > 0 and (limit is None or len(records) < limit):
+                    start = mm.rfind(b"\n", 0, pos - 1) + 1
+                    line = mm[start:pos].strip()
+                    pos = start
+                    if not line:
+                        continue
+                    try:
+                        records.append(loads(line))
+                    except JSONDecodeError:
+                        continue
+    except FileNotFoundError:
+        pass
+    return records
@@ -1,22 +1,27 @@
 from __future__ import annotations
 
-import io
-import json
+import asyncio
 import os
+import stat
 import sys
+import threading
 import uuid
-import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from fastapi import BackgroundTasks, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 
-from backend.cleanup import run_from_env
+from backend.cleanup import file_exists, run_from_env, scan_files
+from backend.export import iter_zip
+from backend.history import HistoryStore
+from backend.jsonio import dumps, read_json, write_jsonl
 from backend.jobs import JobStatus, JobStore
 from backend.models import ModelManager
 from backend.tts import TTSService, VOICE_PRESETS
@@ -47,13 +52,24 @@ def resolve_frontend_dist(base_dir: Path) -> Path:
 BASE_DIR = resolve_base_dir()
 OUTPUT_DIR = BASE_DIR / "outputs"
 AUDIO_DIR = OUTPUT_DIR / "audio"
-HISTORY_PATH = OUTPUT_DIR / "history.json"
+HISTORY_PATH = OUTPUT_DIR / "history.jsonl"
+LEGACY_HISTORY_PATH = OUTPUT_DIR / "history.json"
 JOBS_PATH = OUTPUT_DIR / "jobs.json"
 
 HF_TOKEN = os.getenv("HF_TOKEN") or os.getenv("HUGGINGFACEHUB_API_TOKEN")
 USE_STUB = os.getenv("ORATIO_TTS_STUB", "0") == "1"
 MAX_JOBS = int(os.getenv("ORATIO_JOBS_MAX", "300"))
+MAX_HISTORY = int(os.getenv("ORATIO_CLEAN_MAX_HISTORY", "200"))
+HISTORY_FLUSH_SECONDS = float(os.getenv("ORATIO_HISTORY_FLUSH_SECONDS", "1.0"))
+JOBS_FLUSH_SECONDS = float(os.getenv("ORATIO_JOBS_FLUSH_SECONDS", "0.5"))
+TTS_WORKERS = max(1, int(os.getenv("ORATIO_TTS_WORKERS", "2")))
 TTS_PROVIDER = os.getenv("ORATIO_TTS_PROVIDER", "local")  # auto | inference | local | stub
+TTS_QUANTIZATION = os.getenv("ORATIO_TTS_QUANTIZATION")  # int8 | bf16 (local models)
+TTS_COMPILE = os.getenv("ORATIO_TTS_COMPILE", "0") == "1"
+TTS_DEVICE = os.getenv("ORATIO_TTS_DEVICE") or None  # cpu | cuda | cuda:1 (default: auto)
+TTS_CACHE = os.getenv("ORATIO_TTS_CACHE", "1") == "1"
+TTS_WARMUP = os.getenv("ORATIO_TTS_WARMUP", "").strip()  # "1"/"all" or voice ids
+TTS_PRECONNECT = os.getenv("ORATIO_TTS_PRECONNECT", "1") != "0"
 MODELS_DIR_ENV = os.getenv("ORATIO_MODELS_DIR")
 OPTIONAL_MODELS = {
     m.strip().lower()
@@ -118,60 +134,73 @@ def ensure_directories() -> None:
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def load_history() -> List[dict]:
-    if not HISTORY_PATH.exists():
-        return []
-    try:
-        return json.loads(HISTORY_PATH.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
-        return []
+def migrate_legacy_history() -> None:
+    """Convert the former history.json (newest first) to JSON Lines."""
+    if HISTORY_PATH.exists() or not LEGACY_HISTORY_PATH.exists():
+        return
+    entries = read_json(LEGACY_HISTORY_PATH, default=[])
+    # The JSON Lines file is append-only, so it stores entries oldest first.
+    write_jsonl(HISTORY_PATH, reversed(entries))
+    LEGACY_HISTORY_PATH.unlink()
 
 
-def write_history(entries: List[dict]) -> None:
-    HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
-    HISTORY_PATH.write_text(json.dumps(entries, indent=2, ensure_ascii=False), encoding="utf-8")
+def load_history(limit: Optional[int] = None) -> List[dict]:
+    """Return history entries, newest first, from the in-memory store."""
+    return history_store.list(limit=limit)
 
 
 def append_history(entry: dict) -> None:
-    history = load_history()
-    history.insert(0, entry)
-    write_history(history)
+    history_store.append(entry)
+
+
+def delete_history_entries(job_ids: List[str], delete_audio: bool = True) -> int:
+    """Remove history entries in one pass (one rewrite) and optionally their audio."""
+    removed = history_store.remove_many(job_ids)
+    if delete_audio:
+        for entry in removed:
+            audio_path = entry.get("audio_path")
+            if not audio_path:
+                continue
+            try:
+                os.unlink(audio_path)
+            except OSError:
+                pass
+    return len(removed)
 
 
 def delete_history_entry(job_id: str, delete_audio: bool = True) -> bool:
-    history = load_history()
-    remaining = []
-    removed = False
-    for entry in history:
-        if entry.get("job_id") == job_id:
-            removed = True
-            if delete_audio:
-                audio_path = entry.get("audio_path")
-                if audio_path and Path(audio_path).exists():
-                    try:
-                        Path(audio_path).unlink()
-                    except OSError:
-                        pass
-            continue
-        remaining.append(entry)
-    if removed:
-        write_history(remaining)
-    return removed
+    return delete_history_entries([job_id], delete_audio=delete_audio) > 0
 
 
 def collect_audio_files(job_ids: List[str]) -> List[Path]:
-    history = load_history()
     selected = []
-    requested = set(job_ids)
-    for entry in history:
-        if entry.get("job_id") in requested:
-            audio_path = entry.get("audio_path")
-            if audio_path and Path(audio_path).exists():
-                selected.append(Path(audio_path))
+    existing = scan_files(AUDIO_DIR)
+    for entry in history_store.get_many(job_ids):
+        audio_path = entry.get("audio_path")
+        if audio_path and file_exists(audio_path, existing):
+            selected.append(Path(audio_path))
     return selected
 
 
-app = FastAPI(title="OratioViva API", version="0.3.0")
+def run_cleanup() -> Dict[str, int]:
+    """Purge old audio/history on disk and resync the in-memory history."""
+    return history_store.run_maintenance(lambda: run_from_env(AUDIO_DIR, HISTORY_PATH))
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    # Startup cleanup may stat/unlink many files: keep it off the startup path.
+    if os.getenv("ORATIO_SKIP_STARTUP_CLEANUP", "0") != "1":
+        threading.Thread(target=run_cleanup, name="oratio-cleanup", daemon=True).start()
+    # Connect to the inference router and load local models before the first request.
+    if TTS_PRECONNECT:
+        tts_service.preconnect()
+    if TTS_WARMUP and not tts_service.use_stub:
+        tts_service.warm_up(None if TTS_WARMUP in {"1", "all"} else TTS_WARMUP.split(","))
+    yield
+
+
+app = FastAPI(title="OratioViva API", version="0.3.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -182,6 +211,7 @@ app.add_middleware(
 )
 
 ensure_directories()
+migrate_legacy_history()
 model_manager = ModelManager(
     base_dir=BASE_DIR,
     models_dir=MODELS_DIR,
@@ -198,16 +228,43 @@ tts_service = TTSService(
     provider=TTS_PROVIDER,
     models_dir=MODELS_DIR,
     model_manager=model_manager,
+    quantization=TTS_QUANTIZATION,
+    use_compile=TTS_COMPILE,
+    device=TTS_DEVICE,
+    cache_audio=TTS_CACHE,
+)
+# Voice presets never change at runtime: encode the /voices body once.
+VOICES_JSON = dumps({"voices": tts_service.list_voices()})
+job_store = JobStore(path=JOBS_PATH, max_items=MAX_JOBS, flush_delay=JOBS_FLUSH_SECONDS)
+# Synthesis is blocking (model inference, disk writes): run it on a bounded pool
+# so the event loop stays free for polling while jobs are in flight.
+tts_executor = ThreadPoolExecutor(max_workers=TTS_WORKERS, thread_name_prefix="oratio-tts")
+history_store = HistoryStore(
+    path=HISTORY_PATH, max_items=MAX_HISTORY, flush_delay=HISTORY_FLUSH_SECONDS
 )
-job_store = JobStore(path=JOBS_PATH, max_items=MAX_JOBS)
-# Cleanup on startup (best-effort)
-run_from_env(AUDIO_DIR, HISTORY_PATH)
 
-app.mount("/audio", StaticFiles(directory=AUDIO_DIR), name="audio")
 if FRONTEND_DIST.exists():
     app.mount("/app", StaticFiles(directory=FRONTEND_DIST, html=True), name="frontend")
 
 
+@app.api_route("/audio/{name}", methods=["GET", "HEAD"], name="audio")
+def audio_file(name: str):
+    # Flat directory of generated files: reject anything that is not a bare name.
+    if name != os.path.basename(name) or name.startswith("."):
+        raise HTTPException(status_code=404, detail="Audio not found")
+    path = AUDIO_DIR / name
+    try:
+        stat_result = path.stat()
+    except OSError:
+        raise HTTPException(status_code=404, detail="Audio not found") from None
+    if not stat.S_ISREG(stat_result.st_mode):
+        raise HTTPException(status_code=404, detail="Audio not found")
+    media_type = "audio/wav" if name.lower().endswith(".wav") else None
+    # FileResponse streams from disk (or hands the path to the server when it
+    # supports zero-copy sends) and reuses this stat instead of taking another.
+    return FileResponse(path, media_type=media_type, stat_result=stat_result)
+
+
 @app.get("/health")
 def health():
     return {
@@ -216,14 +273,14 @@ def health():
         "use_stub": USE_STUB,
         "provider": tts_service.current_provider(),
         "voices": len(VOICE_PRESETS),
-        "history_items": len(load_history()),
-        "jobs": len(job_store.list(limit=9999)),
+        "history_items": len(history_store),
+        "jobs": len(job_store),
     }
 
 
 @app.get("/voices")
 def list_voices():
-    return {"voices": tts_service.list_voices()}
+    return Response(content=VOICES_JSON, media_type="application/json")
 
 
 @app.get("/models/status")
@@ -254,7 +311,10 @@ def models_download(body: ModelDownloadRequest, background_tasks: BackgroundTask
         return {"status": "running"}
 
     def _download():
-        model_manager.download(body.models)
+        try:
+            model_manager.download(body.models)
+        finally:
+            tts_service.refresh()
 
     background_tasks.add_task(_download)
     return {"status": "started"}
@@ -284,7 +344,7 @@ def analytics():
             "jobs": len(jobs),
             "audio_duration_seconds": audio_duration,
         },
-        "jobs_recent": [j for j in jobs[:5]],
+        "jobs_recent": [j.to_dict() for j in jobs[:5]],
         "history_recent": history[:5],
     }
 
@@ -337,17 +397,33 @@ def _run_job(
         return job_store.update(job_id, status="failed", error=str(exc))
 
 
+async def _run_job_in_executor(
+    job_id: str,
+    text: str,
+    voice_id: str,
+    speed: float,
+    style: Optional[str],
+    voice_ref: Optional[str],
+) -> JobStatus:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        tts_executor, _run_job, job_id, text, voice_id, speed, style, voice_ref
+    )
+
+
 @app.post("/synthesize", response_model=JobStatusResponse)
-def synthesize(request: SynthesisRequest, background_tasks: BackgroundTasks, async_mode: bool = False):
+async def synthesize(
+    request: SynthesisRequest, background_tasks: BackgroundTasks, async_mode: bool = False
+):
     text = request.text.strip()
     if not text:
         raise HTTPException(status_code=422, detail="Text payload cannot be empty.")
-    job_id = str(uuid.uuid4())
+    job_id = uuid.uuid4().hex
     job_store.create(job_id, status="queued")
 
     if async_mode:
         background_tasks.add_task(
-            _run_job,
+            _run_job_in_executor,
             job_id,
             text,
             request.voice_id,
@@ -357,24 +433,27 @@ def synthesize(request: SynthesisRequest, background_tasks: BackgroundTasks, asy
         )
         job = job_store.get(job_id)
         assert job is not None
-        return JobStatusResponse(**job.__dict__)
+        return JobStatusResponse(**job.to_dict())
 
-    job = _run_job(job_id, text, request.voice_id, request.speed, request.style, request.voice_ref)
-    return JobStatusResponse(**job.__dict__)
+    job = await _run_job_in_executor(
+        job_id, text, request.voice_id, request.speed, request.style, request.voice_ref
+    )
+    return JobStatusResponse(**job.to_dict())
 
 
 @app.get("/jobs/{job_id}", response_model=JobStatusResponse)
 def job_status(job_id: str):
-    job = job_store.get(job_id)
-    if job is None:
+    # Polled by the UI while a job runs: serve the cached encoding directly.
+    payload = job_store.get_json(job_id)
+    if payload is None:
         raise HTTPException(status_code=404, detail="Job not found")
-    return JobStatusResponse(**job.__dict__)
+    return Response(content=payload, media_type="application/json")
 
 
 @app.get("/jobs")
 def job_list(limit: int = 50):
-    jobs = job_store.list(limit=limit)
-    return {"items": [job.__dict__ for job in jobs]}
+    payload = b'{"items":' + job_store.list_json(limit=limit) + b"}"
+    return Response(content=payload, media_type="application/json")
 
 
 @app.delete("/jobs/{job_id}")
@@ -387,10 +466,7 @@ def delete_job(job_id: str):
 
 @app.post("/jobs/batch_delete")
 def batch_delete_jobs(body: BatchDeleteRequest):
-    deleted = 0
-    for job_id in body.job_ids:
-        if job_store.delete(job_id):
-            deleted += 1
+    deleted = job_store.delete_many(body.job_ids)
     if deleted == 0:
         raise HTTPException(status_code=404, detail="No jobs deleted")
     return {"status": "ok", "deleted": deleted}
@@ -398,7 +474,7 @@ def batch_delete_jobs(body: BatchDeleteRequest):
 
 @app.get("/history")
 def history(limit: int = 20):
-    history = load_history()[:limit]
+    history = load_history(limit=limit)
     return {"items": history}
 
 
@@ -412,10 +488,7 @@ def delete_history(job_id: str):
 
 @app.post("/history/batch_delete")
 def batch_delete_history(body: BatchDeleteRequest):
-    deleted = 0
-    for job_id in body.job_ids:
-        if delete_history_entry(job_id, delete_audio=body.delete_audio):
-            deleted += 1
+    deleted = delete_history_entries(body.job_ids, delete_audio=body.delete_audio)
     if deleted == 0:
         raise HTTPException(status_code=404, detail="No history entries deleted")
     return {"status": "ok", "deleted": deleted}
@@ -423,7 +496,7 @@ def batch_delete_history(body: BatchDeleteRequest):
 
 @app.post("/maintenance/cleanup")
 def cleanup_endpoint():
-    summary = run_from_env(AUDIO_DIR, HISTORY_PATH)
+    summary = run_cleanup()
     return {"status": "ok", "cleanup": summary}
 
 
@@ -433,13 +506,8 @@ def export_zip(body: ExportRequest):
     if not files:
         raise HTTPException(status_code=404, detail="No audio files found for given jobs")
 
-    buffer = io.BytesIO()
-    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-        for path in files:
-            zip_file.write(path, arcname=Path(path).name)
-    buffer.seek(0)
     headers = {"Content-Disposition": 'attachment; filename="oratioviva-audio.zip"'}
-    return StreamingResponse(buffer, media_type="application/zip", headers=headers)
+    return StreamingResponse(iter_zip(files), media_type="application/zip", headers=headers)
 
 
 if __name__ == "__main__":
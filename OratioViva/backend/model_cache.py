@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import gc
+import sys
+from collections import OrderedDict
+from threading import RLock
+from typing import Callable, Generic, Optional, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+def release_accelerator_memory() -> None:
+    """Collect dropped models and hand cached CUDA blocks back to the driver."""
+    gc.collect()
+    torch = sys.modules.get("torch")  # never import torch just to clean up
+    if torch is not None and torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
+class ModelCache(OrderedDict, Generic[K, V]):
+    """
+    Dict of loaded models that keeps at most ``maxsize`` entries (0 = unbounded).
+
+    Reads mark an entry as recently used; inserting past the limit drops the least
+    recently used one, calls ``on_evict(key, value)`` and frees accelerator memory.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        on_evict: Optional[Callable[[K, V], None]] = None,
+    ) -> None:
+        super().__init__()
+        self.maxsize = max(0, maxsize)
+        self.on_evict = on_evict
+        self._lock = RLock()
+
+    def __getitem__(self, key: K) -> V:
+        with self._lock:
+            value = super().__getitem__(key)
+            self.move_to_end(key)
+            return value
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:  # type: ignore[override]
+        with self._lock:
+            return self[key] if key in self else default
+
+    def __setitem__(self, key: K, value: V) -> None:
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            evicted = []
+            while self.maxsize and len(self) > self.maxsize:
+                evicted.append(self.popitem(last=False))
+        if not evicted:
+            return
+        for old_key, old_value in evicted:
+            if self.on_evict is not None:
+                self.on_evict(old_key, old_value)
+        del evicted, old_value
+        release_accelerator_memory()
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import importlib.util
+import os
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Set
 
-from huggingface_hub import snapshot_download
+# Use the Rust downloader when installed; huggingface_hub reads this at import time.
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+from huggingface_hub import snapshot_download  # noqa: E402
 
 
 DEFAULT_MODELS: Dict[str, str] = {
@@ -88,17 +95,24 @@ class ModelManager:
                 repo_ids = {
                     key: repo_id for key, repo_id in DEFAULT_MODELS.items() if key not in self.optional_models
                 }
-            for repo_id in repo_ids.values():
-                if self.resolve_model_path(repo_id) is not None:
-                    continue
-                target = self.models_dir / repo_id.replace("/", "_")
-                snapshot_download(
-                    repo_id=repo_id,
-                    local_dir=target,
-                    local_dir_use_symlinks=False,
-                    token=self.token,
-                )
+            missing = [
+                repo_id for repo_id in repo_ids.values() if self.resolve_model_path(repo_id) is None
+            ]
+            if missing:
+                # Repos download independently: overlap them instead of waiting on each.
+                with ThreadPoolExecutor(max_workers=min(6, len(missing))) as pool:
+                    list(pool.map(self._download_repo, missing))
             return self.status()
         finally:
             with self._lock:
                 self._downloading = False
+
+    def _download_repo(self, repo_id: str) -> None:
+        snapshot_download(
+            repo_id=repo_id,
+            local_dir=self.models_dir / repo_id.replace("/", "_"),
+            local_dir_use_symlinks=False,
+            token=self.token,
+            max_workers=4,
+            etag_timeout=10,
+        )
@@ -0,0 +1,13 @@
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+
+def pytest_configure(config):
+    # Set before backend.main is first imported so no module reload is needed.
+    os.environ["ORATIO_TTS_STUB"] = "1"
+    os.environ.setdefault("ORATIO_SKIP_STARTUP_CLEANUP", "1")
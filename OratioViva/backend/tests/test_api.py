@@ -1,24 +1,12 @@
-import importlib
-import os
-import sys
-from pathlib import Path
-
 import pytest
 from httpx import ASGITransport, AsyncClient
 
 
-ROOT = Path(__file__).resolve().parents[2]
-if str(ROOT) not in sys.path:
-    sys.path.append(str(ROOT))
-
-
 @pytest.fixture(scope="session")
 def app():
-    os.environ["ORATIO_TTS_STUB"] = "1"
-    # Reload to apply stub env if already imported.
+    # conftest.py sets ORATIO_TTS_STUB before this first import.
     import backend.main as backend_main
 
-    importlib.reload(backend_main)
     return backend_main.app
 
 
@@ -49,3 +37,33 @@ async def test_voices_and_synthesize(app):
         job = synth_resp.json()
         assert job["status"] == "succeeded"
         assert job["audio_url"].startswith("/audio/")
+
+
+@pytest.mark.asyncio
+async def test_audio_served_and_traversal_rejected(app):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        synth_resp = await client.post(
+            "/synthesize?async_mode=false",
+            json={"text": "Bonjour", "voice_id": "parler_en_neutral", "speed": 1.0},
+        )
+        audio_url = synth_resp.json()["audio_url"]
+
+        audio_resp = await client.get(audio_url)
+        assert audio_resp.status_code == 200
+        assert audio_resp.headers["content-type"] == "audio/wav"
+        assert audio_resp.content[:4] == b"RIFF"
+
+        assert (await client.get("/audio/..%2Fjobs.json")).status_code == 404
+        assert (await client.get("/audio/missing.wav")).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_voices_payload(app):
+    from backend.tts import VOICE_PRESETS
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        resp = await client.get("/voices")
+    assert resp.status_code == 200
+    voices = resp.json()["voices"]
+    assert [voice["id"] for voice in voices] == [voice.id for voice in VOICE_PRESETS]
+    assert set(voices[0]) == {"id", "model", "label", "language", "voice", "description"}
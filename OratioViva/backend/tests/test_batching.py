@@ -0,0 +1,38 @@
+import threading
+
+import pytest
+
+from backend.batching import MicroBatcher
+
+
+def test_micro_batcher_groups_concurrent_calls():
+    batches = []
+
+    def double(items):
+        batches.append(list(items))
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(double, max_batch=4, window=0.2)
+    results = {}
+    barrier = threading.Barrier(4)
+
+    def worker(value):
+        barrier.wait()
+        results[value] = batcher.submit(value)
+
+    threads = [threading.Thread(target=worker, args=(value,)) for value in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert results == {0: 0, 1: 2, 2: 4, 3: 6}
+    assert len(batches) == 1 and sorted(batches[0]) == [0, 1, 2, 3]
+
+
+def test_micro_batcher_forwards_errors():
+    def boom(items):
+        raise ValueError("bad batch")
+
+    with pytest.raises(ValueError, match="bad batch"):
+        MicroBatcher(boom, window=0).submit(1)
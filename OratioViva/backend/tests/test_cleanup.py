@@ -0,0 +1,68 @@
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+from backend.cleanup import cleanup_outputs
+from backend.jsonio import read_jsonl_tail, write_jsonl
+
+
+def test_cleanup_removes_stale_audio_and_history(tmp_path):
+    audio_dir = tmp_path / "audio"
+    audio_dir.mkdir()
+    history_path = tmp_path / "history.jsonl"
+    fresh = audio_dir / "fresh.wav"
+    stale = audio_dir / "stale.wav"
+    other = audio_dir / "notes.txt"
+    for path in (fresh, stale, other):
+        path.write_bytes(b"")
+    old = time.time() - 72 * 3600
+    os.utime(stale, (old, old))
+    os.utime(other, (old, old))
+
+    now = datetime.now(timezone.utc)
+    write_jsonl(
+        history_path,
+        [
+            {"job_id": "old", "created_at": (now - timedelta(hours=72)).isoformat()},
+            {"job_id": "gone", "audio_path": str(stale), "created_at": now.isoformat()},
+            {"job_id": "kept", "audio_path": str(fresh), "created_at": now.isoformat()},
+        ],
+    )
+
+    summary = cleanup_outputs(audio_dir, history_path, max_age_hours=48)
+
+    assert summary == {"removed_files": 1, "removed_history": 2, "remaining_history": 1}
+    assert sorted(p.name for p in audio_dir.iterdir()) == ["fresh.wav", "notes.txt"]
+    assert [e["job_id"] for e in read_jsonl_tail(history_path)] == ["kept"]
+
+
+def test_cleanup_prunes_stale_cache_entries(tmp_path):
+    cache_dir = tmp_path / "audio" / "cache"
+    cache_dir.mkdir(parents=True)
+    stale = cache_dir / "stale.wav"
+    fresh = cache_dir / "fresh.wav"
+    for path in (stale, fresh):
+        path.write_bytes(b"")
+    old = time.time() - 72 * 3600
+    os.utime(stale, (old, old))
+
+    summary = cleanup_outputs(tmp_path / "audio", tmp_path / "history.jsonl", max_age_hours=48)
+
+    assert summary["removed_files"] == 1
+    assert [p.name for p in cache_dir.iterdir()] == ["fresh.wav"]
+
+
+def test_cleanup_prunes_stale_speaker_embeddings(tmp_path):
+    xvector_dir = tmp_path / "audio" / "cache" / "xvectors"
+    xvector_dir.mkdir(parents=True)
+    stale = xvector_dir / "stale.npy"
+    fresh = xvector_dir / "fresh.npy"
+    for path in (stale, fresh):
+        path.write_bytes(b"")
+    old = time.time() - 72 * 3600
+    os.utime(stale, (old, old))
+
+    summary = cleanup_outputs(tmp_path / "audio", tmp_path / "history.jsonl", max_age_hours=48)
+
+    assert summary["removed_files"] == 1
+    assert [p.name for p in xvector_dir.iterdir()] == ["fresh.npy"]
@@ -0,0 +1,20 @@
+import io
+import zipfile
+
+from backend.export import iter_zip
+
+
+def test_iter_zip_streams_stored_archive(tmp_path):
+    first = tmp_path / "a.wav"
+    second = tmp_path / "b.wav"
+    first.write_bytes(b"RIFF" + bytes(range(256)) * 10)
+    second.write_bytes(b"RIFF")
+
+    chunks = list(iter_zip([first, second], chunk_size=512))
+
+    assert len(chunks) > 2
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as archive:
+        assert archive.testzip() is None
+        assert [i.compress_type for i in archive.infolist()] == [zipfile.ZIP_STORED] * 2
+        assert archive.read("a.wav") == first.read_bytes()
+        assert archive.read("b.wav") == b"RIFF"
@@ -0,0 +1,72 @@
+import threading
+
+from backend.history import HistoryStore
+from backend.jsonio import write_jsonl
+
+
+def test_history_store_flushes_and_reloads(tmp_path):
+    path = tmp_path / "history.jsonl"
+    store = HistoryStore(path=path, max_items=2, flush_delay=60)
+    for job_id in ("a", "b", "c"):
+        store.append({"job_id": job_id})
+
+    assert [e["job_id"] for e in store.list()] == ["c", "b"]
+    assert not path.exists()  # nothing written until flushed
+
+    store.flush()
+    assert [e["job_id"] for e in HistoryStore(path=path, max_items=2).list()] == ["c", "b"]
+
+
+def test_history_store_remove_rewrites_file(tmp_path):
+    path = tmp_path / "history.jsonl"
+    store = HistoryStore(path=path, flush_delay=0)
+    store.append({"job_id": "a"})
+    store.append({"job_id": "b"})
+
+    assert store.remove("a") == {"job_id": "a"}
+    assert store.remove("missing") is None
+    assert [e["job_id"] for e in HistoryStore(path=path).list()] == ["b"]
+
+
+def test_history_store_index_tracks_evictions():
+    store = HistoryStore(max_items=2)
+    for job_id in ("a", "b", "c"):
+        store.append({"job_id": job_id})
+
+    assert [e["job_id"] for e in store.get_many(["c", "a", "b", "c"])] == ["c", "b"]
+    assert store.remove_many(["a"]) == []
+    assert [e["job_id"] for e in store.remove_many(["b"])] == ["b"]
+    assert store.get_many(["b"]) == []
+
+
+def test_run_maintenance_does_not_block_the_store(tmp_path):
+    path = tmp_path / "history.jsonl"
+    store = HistoryStore(path=path, flush_delay=60)
+    store.append({"job_id": "old"})
+    store.append({"job_id": "gone"})
+    started, release = threading.Event(), threading.Event()
+
+    def slow_cleanup():
+        started.set()
+        assert release.wait(5)
+        write_jsonl(path, [{"job_id": "old"}, {"job_id": "gone"}, {"job_id": "pruned-elsewhere"}])
+        return "done"
+
+    worker = threading.Thread(target=lambda: store.run_maintenance(slow_cleanup))
+    worker.start()
+    assert started.wait(5)
+    appender = threading.Thread(target=lambda: store.append({"job_id": "new"}))
+    appender.start()
+    appender.join(1)
+    assert not appender.is_alive()  # the append did not wait for the scan
+    assert store.remove("gone") == {"job_id": "gone"}
+    release.set()
+    worker.join(5)
+
+    assert [e["job_id"] for e in store.list()] == ["new", "pruned-elsewhere", "old"]
+    store.flush()
+    assert [e["job_id"] for e in HistoryStore(path=path).list()] == [
+        "new",
+        "pruned-elsewhere",
+        "old",
+    ]
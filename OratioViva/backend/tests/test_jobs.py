@@ -0,0 +1,56 @@
+import json
+
+from backend.jobs import JobStore
+
+
+def test_job_store_orders_by_update_and_flushes(tmp_path):
+    path = tmp_path / "jobs.json"
+    store = JobStore(path=path, max_items=2, flush_delay=60)
+    for job_id in ("a", "b", "c"):
+        store.create(job_id)
+    store.update("a", status="running")
+
+    assert [j.job_id for j in store.list()] == ["a", "c", "b"]
+    assert not path.exists()  # nothing written until flushed
+
+    store.flush()
+    reloaded = JobStore(path=path)
+    assert [j.job_id for j in reloaded.list()] == ["a", "c"]
+    assert reloaded.get("a").status == "running"
+
+
+def test_job_store_json_cache_follows_updates():
+    store = JobStore()
+    store.create("a")
+    first = store.get_json("a")
+    assert store.get_json("a") is first
+
+    store.update("a", status="succeeded")
+    assert b'"succeeded"' in store.get_json("a")
+    assert [job["job_id"] for job in json.loads(store.list_json(limit=5))] == ["a"]
+    assert store.get_json("missing") is None
+
+
+def test_job_store_keeps_epoch_times_and_encodes_iso(tmp_path):
+    path = tmp_path / "jobs.json"
+    path.write_text(
+        json.dumps(
+            [
+                {
+                    "job_id": "old",
+                    "status": "succeeded",
+                    "created_at": "2024-01-01T00:00:00",
+                    "updated_at": "2024-01-01T00:00:05+00:00",
+                }
+            ]
+        )
+    )
+    store = JobStore(path=path, flush_delay=0)
+    job = store.get("old")
+    assert job.updated_at - job.created_at == 5.0
+
+    store.create("new")
+    assert isinstance(store.get("new").created_at, float)
+    encoded = json.loads(store.get_json("old"))
+    assert encoded["created_at"] == "2024-01-01T00:00:00+00:00"
+    assert json.loads(path.read_text())[0]["job_id"] == "new"
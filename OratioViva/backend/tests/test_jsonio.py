@@ -0,0 +1,18 @@
+from backend.jsonio import append_jsonl, read_jsonl_tail, write_jsonl
+
+
+def test_jsonl_tail_reads_newest_first(tmp_path):
+    path = tmp_path / "history.jsonl"
+    write_jsonl(path, [{"job_id": "a"}, {"job_id": "b"}])
+    append_jsonl(path, [{"job_id": "c", "text_preview": "ligne\nsuivante"}])
+
+    assert [e["job_id"] for e in read_jsonl_tail(path)] == ["c", "b", "a"]
+    assert [e["job_id"] for e in read_jsonl_tail(path, limit=2)] == ["c", "b"]
+
+
+def test_jsonl_tail_skips_torn_lines(tmp_path):
+    path = tmp_path / "history.jsonl"
+    path.write_bytes(b'{"job_id": "a"}\n{"job_id": "b"}\n{"job_')
+
+    assert [e["job_id"] for e in read_jsonl_tail(path)] == ["b", "a"]
+    assert read_jsonl_tail(tmp_path / "missing.jsonl") == []
@@ -0,0 +1,23 @@
+from backend.model_cache import ModelCache
+
+
+def test_model_cache_evicts_least_recently_used():
+    evicted = []
+    cache = ModelCache(2, on_evict=lambda key, value: evicted.append((key, value)))
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache["a"] == 1  # "b" is now the oldest
+
+    cache["c"] = 3
+
+    assert evicted == [("b", 2)]
+    assert list(cache) == ["a", "c"]
+    assert cache.get("b") is None and cache.get("a") == 1
+
+
+def test_model_cache_is_unbounded_by_default():
+    cache = ModelCache()
+    for index in range(50):
+        cache[index] = index
+
+    assert len(cache) == 50
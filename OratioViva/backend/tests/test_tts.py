@@ -0,0 +1,615 @@
+import asyncio
+import sys
+import threading
+import time
+import types
+import wave
+from datetime import datetime, timezone
+
+import pytest
+
+from backend import tts
+from backend.model_cache import ModelCache
+from backend.tts import TTSService
+
+
+@pytest.fixture
+def service(tmp_path):
+    """Stub-mode service writing into the test's tmp_path."""
+    return TTSService(audio_dir=tmp_path, use_stub=True)
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_stub_audio_matches_duration(tmp_path, monkeypatch, use_numpy):
+    if use_numpy and tts.np is None:
+        pytest.skip("numpy not installed")
+    if not use_numpy:
+        monkeypatch.setattr(tts, "np", None)
+    tts._STUB_TONES.clear()
+    service = TTSService(audio_dir=tmp_path, use_stub=True)
+    destination = tmp_path / "stub.wav"
+
+    duration = service._generate_stub_audio("x" * 40, destination, speed=2.0)
+
+    assert duration == pytest.approx(1.0)
+    with wave.open(str(destination), "rb") as wav_in:
+        assert wav_in.getframerate() == 24_000
+        assert wav_in.getnframes() == 24_000
+        frames = wav_in.readframes(2)
+    assert frames[:2] == b"\x00\x00" and frames[2:] != b"\x00\x00"
+
+
+def test_stub_tone_fallback_matches_numpy(monkeypatch):
+    if tts.np is None:
+        pytest.skip("numpy not installed")
+    expected = tts._stub_tone(1_000, 24_000)
+    monkeypatch.setattr(tts, "np", None)
+
+    assert tts._stub_tone(1_000, 24_000) == expected
+
+
+def test_stub_pcm_slices_one_cached_tone(tmp_path, monkeypatch):
+    tts._STUB_TONES.clear()
+    rendered = []
+    render = tts._stub_tone
+
+    def counting_render(frame_count, sample_rate):
+        rendered.append(frame_count)
+        return render(frame_count, sample_rate)
+
+    monkeypatch.setattr(tts, "_stub_tone", counting_render)
+    service = TTSService(audio_dir=tmp_path, use_stub=True)
+    service._generate_stub_audio("x" * 100, tmp_path / "long.wav")
+    service._generate_stub_audio("bonjour", tmp_path / "a.wav")
+    service._generate_stub_audio("salut", tmp_path / "b.wav", speed=1.3)
+
+    assert rendered == [120_000]
+    assert (tmp_path / "a.wav").read_bytes()[44:] == (tmp_path / "long.wav").read_bytes()[44 : 44 + 48_000]
+
+
+def test_stub_service_renders_tone_up_front(tmp_path, monkeypatch):
+    tts._STUB_TONES.clear()
+    TTSService(audio_dir=tmp_path, use_stub=True)
+    monkeypatch.setattr(tts, "_stub_tone", None)  # any render from here on would fail
+
+    assert len(tts._stub_pcm(24_000)) == 48_000
+    assert len(tts._stub_pcm(int(tts.STUB_MAX_SECONDS * 24_000))) == 240_000
+
+
+def test_write_pcm_wav_matches_wave_module(tmp_path):
+    pcm = bytes(range(256)) * 4
+    tts._write_pcm_wav(tmp_path / "fast.wav", pcm, 22_050)
+    with wave.open(str(tmp_path / "ref.wav"), "wb") as wav_out:
+        wav_out.setnchannels(1)
+        wav_out.setsampwidth(2)
+        wav_out.setframerate(22_050)
+        wav_out.writeframes(pcm)
+
+    assert (tmp_path / "fast.wav").read_bytes() == (tmp_path / "ref.wav").read_bytes()
+
+
+@pytest.mark.asyncio
+async def test_asynthesize_runs_stub_off_loop(service):
+    results = await asyncio.gather(
+        *(service.asynthesize(text="Bonjour", voice_id="parler_en_neutral") for _ in range(3))
+    )
+
+    assert len({result.job_id for result in results}) == 3
+    assert all(result.audio_path.exists() and result.source == "stub" for result in results)
+
+
+def test_unknown_quantization_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        TTSService(audio_dir=tmp_path, quantization="fp4")
+    assert TTSService(audio_dir=tmp_path, quantization="INT8").quantization == "int8"
+
+
+@pytest.mark.parametrize("use_soundfile", [True, False])
+def test_write_array_to_wav_normalizes_without_touching_input(
+    service, tmp_path, monkeypatch, use_soundfile
+):
+    np = pytest.importorskip("numpy")
+    if use_soundfile and tts.sf is None:
+        pytest.skip("soundfile not installed")
+    if not use_soundfile:
+        monkeypatch.setattr(tts, "sf", None)
+    audio = np.array([0.0, 0.25, -0.5, 0.1], dtype=np.float32)
+    original = audio.copy()
+
+    duration = service._write_array_to_wav(audio, 4, tmp_path / "out.wav")
+
+    assert duration == 1.0
+    assert np.array_equal(audio, original)
+    with wave.open(str(tmp_path / "out.wav"), "rb") as wav_in:
+        written = np.frombuffer(wav_in.readframes(4), dtype=np.int16)
+    expected = (original / 0.5 * 32767).astype(np.int16)
+    assert np.array_equal(written, expected)
+
+
+@pytest.mark.parametrize("speed", [1.0, 2.0])
+def test_write_wav_bytes_keeps_payload(service, tmp_path, speed):
+    source = tmp_path / "source.wav"
+    tts._write_pcm_wav(source, b"\x01\x00" * 16_000, 16_000)
+    destination = tmp_path / "copy.wav"
+
+    duration = service._write_wav_bytes(source.read_bytes(), destination, speed=speed)
+
+    assert duration == pytest.approx(1.0 / speed)
+    with wave.open(str(destination), "rb") as wav_in:
+        assert wav_in.getframerate() == int(16_000 * speed)
+        assert wav_in.readframes(16_000) == b"\x01\x00" * 16_000
+    if speed == 1.0:
+        assert destination.read_bytes() == source.read_bytes()
+
+
+def test_write_wav_bytes_reads_rate_past_extra_chunks(service, tmp_path):
+    source = tmp_path / "source.wav"
+    tts._write_pcm_wav(source, b"\x01\x00" * 8_000, 16_000)
+    raw = source.read_bytes()
+    # Provider WAVs may carry metadata chunks between fmt and data.
+    with_list = raw[:36] + b"LIST" + (6).to_bytes(4, "little") + b"INFOab" + raw[36:]
+    destination = tmp_path / "copy.wav"
+
+    assert tts._wav_layout(with_list) == (12, 16_000, 2, 16_000)
+    assert service._write_wav_bytes(with_list, destination, speed=2.0) == pytest.approx(0.25)
+    with wave.open(str(destination), "rb") as wav_in:
+        assert wav_in.getframerate() == 32_000
+
+
+def test_tts_pipeline_call_shape_is_remembered(service, tmp_path):
+    calls = []
+
+    class Pipeline:
+        def __call__(self, text, **kwargs):
+            calls.append(sorted(kwargs))
+            if "ref_audio" not in kwargs or "ref_text" not in kwargs:
+                raise TypeError("unexpected keyword")
+            return {"audio": [0.0], "sampling_rate": 16_000}
+
+    pipe = Pipeline()
+    for _ in range(2):
+        calls.clear()
+        service._run_tts_pipeline(
+            pipe, "hi", speed=1.0, voice_ref_path=tmp_path / "ref.wav", prompt_text="hi"
+        )
+
+    assert calls == [["ref_audio", "ref_text"]]
+
+
+def test_pipeline_call_shapes_skip_names_outside_signature():
+    def pipe(text, speaker_wav=None):
+        return text
+
+    assert tts._pipeline_call_shapes(pipe, True, False, False) == [("speaker_wav", None, False)]
+
+
+def test_preconnect_opens_router_connection(tmp_path, monkeypatch):
+    heads = []
+
+    class Session:
+        def head(self, url, timeout):
+            heads.append(url)
+
+    monkeypatch.setattr(tts, "get_session", lambda: Session())
+    assert TTSService(audio_dir=tmp_path, use_stub=True, hf_token="hf_x").preconnect() is None
+
+    service = TTSService(audio_dir=tmp_path, provider="inference", hf_token="hf_x")
+    service.preconnect().join(timeout=5)
+
+    assert heads == ["https://router.huggingface.co/hf-inference"]
+    assert service._client is not None
+
+
+def test_auto_provider_is_cached_until_refresh(tmp_path, monkeypatch):
+    service = TTSService(audio_dir=tmp_path, provider="auto")
+    calls = []
+
+    def has_local_models(model_id=None):
+        calls.append(model_id)
+        return False
+
+    monkeypatch.setattr(service, "_has_local_models", has_local_models)
+    assert service.current_provider() == "stub"
+    assert service.current_provider() == "stub"
+    assert calls == [None]
+
+    service.refresh()
+    service.hf_token = "token"
+    assert service.current_provider() == "inference"
+    assert calls == [None, None]
+
+
+def test_local_model_lookup_resolves_only_that_repo(tmp_path, monkeypatch):
+    class Manager:
+        def status(self):
+            raise AssertionError("status() scans every model")
+
+        def resolve_model_path(self, repo_id):
+            return tmp_path if repo_id == "facebook/mms-tts-eng" else None
+
+    monkeypatch.setattr(tts, "_local_support", lambda model_id: (True, None))
+    service = TTSService(audio_dir=tmp_path, provider="auto", model_manager=Manager())
+
+    assert service._has_local_models("facebook/mms-tts-eng")
+    assert not service._has_local_models("microsoft/speecht5_tts")
+
+
+def test_parler_description_ids_are_memoized_per_model(service):
+    calls = []
+
+    class Ids:
+        def to(self, device):
+            return (device, self)
+
+    class Tokenizer:
+        def __call__(self, text, return_tensors):
+            calls.append(text)
+            return type("Encoded", (), {"input_ids": Ids()})()
+
+    encode = service._parler_description_ids("parler", Tokenizer(), "cpu")
+    first = encode("Neutral")
+
+    assert service._parler_description_ids("parler", Tokenizer(), "cpu")("Neutral") is first
+    assert calls == ["Neutral"]
+    service._forget_local_model("parler", None)
+    assert "parler" not in service._parler_descriptions
+
+
+def test_local_voice_ref_path_requires_a_regular_file(service, tmp_path):
+    clip = tmp_path / "ref.wav"
+    clip.write_bytes(b"RIFF")
+
+    assert service._resolve_local_voice_ref_path(str(clip)) == clip
+    for missing in (tmp_path / "missing.wav", tmp_path):
+        with pytest.raises(RuntimeError, match="introuvable"):
+            service._resolve_local_voice_ref_path(str(missing))
+
+
+def test_compile_cache_lives_next_to_models(tmp_path, monkeypatch):
+    monkeypatch.setenv("TORCHINDUCTOR_CACHE_DIR", "")  # restored after the test
+    monkeypatch.delenv("TORCHINDUCTOR_CACHE_DIR")
+    TTSService(audio_dir=tmp_path, use_stub=True, models_dir=tmp_path / "models")
+    assert "TORCHINDUCTOR_CACHE_DIR" not in tts.os.environ
+
+    TTSService(audio_dir=tmp_path, use_stub=True, models_dir=tmp_path / "models", use_compile=True)
+    assert tts.os.environ["TORCHINDUCTOR_CACHE_DIR"] == str(tmp_path / "models" / ".inductor_cache")
+
+
+def test_bucket_length_rounds_up_to_few_shapes():
+    assert [tts._bucket_length(n) for n in (1, 32, 33, 100, 512, 600)] == [32, 32, 64, 128, 512, 600]
+
+
+def test_numba_stub_kernel_matches_numpy():
+    pytest.importorskip("numba")
+    np = pytest.importorskip("numpy")
+    kernel = tts._build_stub_kernel()
+    tts._STUB_TONES.clear()
+
+    numba_pcm = np.empty(2400, dtype=np.int16)
+    kernel(numba_pcm, 2 * np.pi * 440.0 / 24_000, 0.2 * 32767)
+    numpy_pcm = np.frombuffer(tts._stub_pcm(2400), dtype=np.int16)
+
+    assert np.abs(numba_pcm.astype(int) - numpy_pcm).max() <= 1
+
+
+def test_audio_cache_reuses_model_output(tmp_path, monkeypatch):
+    service = TTSService(audio_dir=tmp_path, provider="inference", cache_audio=True)
+    calls = []
+
+    def fake_inference(*, destination, **kwargs):
+        calls.append(destination)
+        tts._write_pcm_wav(destination, b"\x00\x01" * 8_000, 16_000)
+        return "generated"
+
+    monkeypatch.setattr(service, "_synthesize_inference", fake_inference)
+    assert service.synthesize(text="Salut", voice_id="speecht5_en_0", job_id="a") == "generated"
+
+    cached = service.synthesize(text="Salut", voice_id="speecht5_en_0", job_id="b")
+    assert cached.source == "inference" and cached.duration_seconds == 0.5
+    assert (tmp_path / "b.wav").read_bytes() == (tmp_path / "a.wav").read_bytes()
+    assert len(calls) == 1
+
+    service.synthesize(text="Salut", voice_id="speecht5_en_0", speed=1.5, job_id="c")
+    assert len(calls) == 2
+
+    # Sampling models render a new take every time.
+    service.synthesize(text="Salut", voice_id="mms_en_0", job_id="d")
+    service.synthesize(text="Salut", voice_id="mms_en_0", job_id="e")
+    assert len(calls) == 4
+
+
+def test_audio_cache_entry_survives_job_file_rewrite(tmp_path, monkeypatch):
+    service = TTSService(audio_dir=tmp_path, provider="inference", cache_audio=True)
+    monkeypatch.setattr(
+        service,
+        "_synthesize_inference",
+        lambda *, destination, **kwargs: tts._write_pcm_wav(destination, b"\x01\x00" * 800, 8_000),
+    )
+    service.synthesize(text="Salut", voice_id="speecht5_en_0", job_id="a")
+    service.synthesize(text="Salut", voice_id="speecht5_en_0", job_id="b")
+    voice = tts.VOICE_BY_ID["speecht5_en_0"]
+    cache_path = service._audio_cache_path("inference", voice, 1.0, None, "Salut")
+    original = cache_path.read_bytes()
+
+    with (tmp_path / "b.wav").open("wb") as fh:  # O_TRUNC rewrite of the job file
+        fh.write(b"junk")
+
+    assert cache_path.read_bytes() == original
+
+
+def test_local_audio_cache_key_tracks_quantization_and_device(tmp_path):
+    voice = tts.VOICE_BY_ID["speecht5_en_0"]
+    paths = {
+        TTSService(audio_dir=tmp_path, cache_audio=True, quantization=q, device=d)
+        ._audio_cache_path("local", voice, 1.0, None, "Salut")
+        for q, d in [(None, "cpu"), ("int8", "cpu"), (None, "cuda")]
+    }
+    assert len(paths) == 3
+
+
+def test_local_dispatch_uses_model_family(tmp_path, monkeypatch):
+    service = TTSService(audio_dir=tmp_path)
+    seen = {}
+
+    def fake_handler(**kwargs):
+        seen.update(kwargs)
+        return "done"
+
+    monkeypatch.setitem(service._local_handlers, "speecht5", fake_handler)
+    result = service._synthesize_local(
+        text="Hi",
+        voice=tts.VOICE_BY_ID["speecht5_en_0"],
+        job_id="job",
+        destination=tmp_path / "job.wav",
+        speed=1.0,
+        style=None,
+        voice_ref="ref.wav",
+        created_at=None,
+    )
+
+    assert result == "done" and seen["voice_ref"] == "ref.wav"
+    assert tts.VOICE_FAMILY["mms_en_0"] == "mms"
+    assert tts._model_family("SWivid/F5-TTS") == "f5-tts"
+
+
+def test_synthesize_many_keeps_request_order(service):
+    requests = [
+        {"text": "x" * n, "voice_id": "parler_en_neutral", "job_id": f"job-{n}"} for n in (20, 60, 100)
+    ]
+
+    results = service.synthesize_many(requests)
+
+    assert [result.job_id for result in results] == ["job-20", "job-60", "job-100"]
+    assert [result.duration_seconds for result in results] == [1.0, 3.0, 5.0]
+
+
+def test_warm_up_renders_available_local_voices(tmp_path, monkeypatch):
+    service = TTSService(audio_dir=tmp_path, provider="local")
+    rendered = []
+    monkeypatch.setattr(service, "_has_local_models", lambda model_id=None: "mms" in model_id)
+    monkeypatch.setattr(service, "_synthesize_local", lambda **kwargs: rendered.append(kwargs["voice"].id))
+
+    service.warm_up(["mms_en_0", "bark_en_0", "xtts_v2_multi", "unknown"]).join(timeout=5)
+
+    assert rendered == ["mms_en_0"]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_device_defaults_to_cpu_without_cuda(tmp_path):
+    assert TTSService(audio_dir=tmp_path, device="cuda:1")._device() == "cuda:1"
+    try:
+        import torch
+    except ImportError:
+        assert TTSService(audio_dir=tmp_path)._device() == "cpu"
+    else:
+        expected = "cuda" if torch.cuda.is_available() else "cpu"
+        assert TTSService(audio_dir=tmp_path)._device() == expected
+
+
+def test_write_array_to_wav_silences_non_finite_samples(service, tmp_path):
+    np = pytest.importorskip("numpy")
+    audio = np.array([[0.5, 0.5], [np.nan, np.nan], [-1.0, -1.0], [np.inf, np.inf]], dtype=np.float64)
+
+    service._write_array_to_wav(audio, 4, tmp_path / "out.wav")
+
+    with wave.open(str(tmp_path / "out.wav"), "rb") as wav_in:
+        written = np.frombuffer(wav_in.readframes(4), dtype=np.int16)
+    assert written.tolist() == [16383, 0, -32767, 0]
+
+
+def test_write_buffers_handles_partial_writes(tmp_path, monkeypatch):
+    if not hasattr(tts.os, "writev"):
+        pytest.skip("writev not available")
+    real_writev = tts.os.writev
+
+    def short_writev(fd, views):
+        return real_writev(fd, [bytes(views[0][:3])])  # at most 3 bytes per call
+
+    monkeypatch.setattr(tts.os, "writev", short_writev)
+    tts._write_buffers(tmp_path / "out.bin", [b"header", bytearray(b"-payload")])
+
+    assert (tmp_path / "out.bin").read_bytes() == b"header-payload"
+
+
+@pytest.mark.asyncio
+async def test_asynthesize_awaits_async_inference_client(tmp_path):
+    source = tmp_path / "source.wav"
+    tts._write_pcm_wav(source, b"\x00\x01" * 4_000, 8_000)
+
+    class FakeAsyncClient:
+        calls = []
+
+        async def text_to_speech(self, text, *, model, **kwargs):
+            self.calls.append((text, model))
+            return source.read_bytes()
+
+    service = TTSService(audio_dir=tmp_path, provider="inference")
+    service._async_client = FakeAsyncClient()
+
+    result = await service.asynthesize(text="Hello", voice_id="mms_en_0", job_id="job")
+
+    assert FakeAsyncClient.calls == [("Hello", "facebook/mms-tts-eng")]
+    assert result.source == "inference" and result.duration_seconds == 0.5
+    assert (tmp_path / "job.wav").read_bytes() == source.read_bytes()
+
+
+def test_concurrent_first_requests_load_a_pipeline_once(tmp_path, monkeypatch):
+    loads = []
+
+    def fake_pipeline(**kwargs):
+        loads.append(kwargs["model"])
+        time.sleep(0.05)  # keep the other threads waiting on the load
+        return object()
+
+    monkeypatch.setitem(sys.modules, "transformers", types.SimpleNamespace(pipeline=fake_pipeline))
+    service = TTSService(audio_dir=tmp_path, device="cpu")
+    pipes = []
+    threads = [
+        threading.Thread(target=lambda: pipes.append(service._get_local_pipeline("org/model")))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loads == ["org/model"]
+    assert len(set(map(id, pipes))) == 1
+
+
+def test_to_device_pins_and_copies_tokenizer_outputs_async():
+    calls = []
+
+    class FakeTensor:
+        def pin_memory(self):
+            calls.append("pin")
+            return self
+
+        def to(self, device, non_blocking=False):
+            calls.append((device, non_blocking))
+            return self
+
+    inputs = {"input_ids": FakeTensor(), "attention_mask": FakeTensor()}
+
+    assert tts._to_device(inputs, "cpu") is inputs and calls == []
+    assert tts._to_device(inputs, "cuda:0") is inputs
+    assert calls == ["pin", ("cuda:0", True)] * 2
+
+
+@pytest.mark.parametrize("use_soundfile", [True, False])
+def test_write_array_to_wav_streams_blocks(service, tmp_path, monkeypatch, use_soundfile):
+    np = pytest.importorskip("numpy")
+    if use_soundfile and tts.sf is None:
+        pytest.skip("soundfile not installed")
+    if not use_soundfile:
+        monkeypatch.setattr(tts, "sf", None)
+    monkeypatch.setattr(tts, "_PCM_BLOCK", 3)
+    audio = np.array([0.5, -1.0, 0.25, 1.0, 0.0, -0.5, 1.0, 0.75])
+
+    duration = service._write_array_to_wav(audio, 8, tmp_path / "out.wav")
+
+    assert duration == 1.0 and len(tts._PCM_SCRATCH.buffer) == 3
+    with wave.open(str(tmp_path / "out.wav"), "rb") as wav_in:
+        assert wav_in.getnframes() == 8
+        written = np.frombuffer(wav_in.readframes(8), dtype=np.int16)
+    assert written.tolist() == (audio * 32767).astype(np.int16).tolist()
+
+
+def test_split_sentences_and_crossfade_concat():
+    np = pytest.importorskip("numpy")
+    assert tts._split_sentences(" Hi there. How are you?  Fine! ") == [
+        "Hi there.",
+        "How are you?",
+        "Fine!",
+    ]
+
+    joined = tts._crossfade_concat([np.ones(4, dtype=np.float32), np.zeros(3, dtype=np.float32)], 2)
+
+    assert joined.tolist() == [1.0, 1.0, 1.0, 0.0, 0.0]
+
+
+def test_cpu_budget_follows_affinity(monkeypatch):
+    monkeypatch.setattr(tts.os, "sched_getaffinity", lambda pid: {0, 3}, raising=False)
+    assert tts._cpu_budget() == 2
+
+    monkeypatch.delattr(tts.os, "sched_getaffinity")
+    monkeypatch.setattr(tts.os, "cpu_count", lambda: 6)
+    assert tts._cpu_budget() == 6
+
+
+def test_evicted_entry_is_not_read_back_after_loading(tmp_path, monkeypatch):
+    np = pytest.importorskip("numpy")
+
+    class InterleavedCache(ModelCache):
+        def __setitem__(self, key, value):
+            super().__setitem__(key, value)
+            if key == "org/a":  # another worker's load lands right after this insert
+                super().__setitem__("org/b", object())
+
+    class FakeBark:
+        model = None
+
+        def __call__(self, text):
+            return {"audio": np.ones(8, dtype=np.float32), "sampling_rate": 8}
+
+    fake_transformers = types.SimpleNamespace(pipeline=lambda **kwargs: FakeBark())
+    monkeypatch.setitem(sys.modules, "transformers", fake_transformers)
+    service = TTSService(audio_dir=tmp_path, device="cpu")
+    service._local_pipelines = InterleavedCache(1, on_evict=service._forget_local_model)
+    monkeypatch.setattr(service, "_optimize_model", lambda model, **kwargs: model)
+
+    result = service._synthesize_bark_local(
+        text="Salut",
+        voice=tts.VOICE_BY_ID["bark_en_0"],
+        job_id="a",
+        destination=tmp_path / "a.wav",
+        speed=1.0,
+        style=None,
+        created_at=datetime.now(timezone.utc),
+        model_path="org/a",
+    )
+
+    assert result.duration_seconds == 1.0
+    assert list(service._local_pipelines) == ["org/b"]
+
+
+def test_evicting_a_model_drops_its_placed_speaker_embeddings(tmp_path):
+    service = TTSService(audio_dir=tmp_path)
+    service._speaker_embeddings[("clip", "org/a", "cpu")] = "placed-a"
+    service._speaker_embeddings[("clip", "org/b", "cpu")] = "placed-b"
+    service._local_pipelines = ModelCache(1, on_evict=service._forget_local_model)
+
+    service._local_pipelines["org/a"] = "model-a"
+    service._local_pipelines["org/b"] = "model-b"
+
+    assert list(service._speaker_embeddings) == [("clip", "org/b", "cpu")]
+
+
+def test_mms_batches_sentences_in_chunks_of_max_batch(tmp_path, monkeypatch):
+    np = pytest.importorskip("numpy")
+    monkeypatch.setitem(sys.modules, "torch", types.SimpleNamespace())
+    monkeypatch.setattr(tts, "_vits_classes", lambda: (None, None))
+    monkeypatch.setattr(tts, "MAX_BATCH", 2)
+    service = TTSService(audio_dir=tmp_path)
+    model = types.SimpleNamespace(config=types.SimpleNamespace(sampling_rate=1000))
+    service._local_pipelines["org/mms"] = (None, model)
+    batches = []
+
+    def fake_forward(processor, model, texts):
+        batches.append(list(texts))
+        return [np.ones(100, dtype=np.float32) for _ in texts]
+
+    monkeypatch.setattr(service, "_mms_forward", fake_forward)
+    result = service._synthesize_mms_local(
+        text="One. Two. Three. Four. Five.",
+        voice=tts.VOICE_BY_ID["mms_en_0"],
+        job_id="a",
+        destination=tmp_path / "a.wav",
+        speed=1.0,
+        style=None,
+        created_at=datetime.now(timezone.utc),
+        model_path="org/mms",
+    )
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert result.duration_seconds == pytest.approx((500 - 4 * 5) / 1000)
@@ -1,17 +1,57 @@
 from __future__ import annotations
 
+import array
+import asyncio
+import functools
+import hashlib
+import inspect
 import io
 import math
 import struct
 import uuid
 import wave
 import os
-from dataclasses import dataclass
+import re
+import shutil
+import stat
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from huggingface_hub import AsyncInferenceClient, InferenceClient
+from huggingface_hub.constants import INFERENCE_PROXY_TEMPLATE
+from huggingface_hub.utils import get_session
+
+from backend.batching import MicroBatcher
+from backend.model_cache import ModelCache
 
-from huggingface_hub import InferenceClient
+try:
+    import numpy as np
+except ImportError:  # numpy ships with the optional "tts" extra
+    np = None  # type: ignore[assignment]
+
+try:
+    import soundfile as sf
+except (ImportError, OSError):  # OSError: package present but libsndfile missing
+    sf = None  # type: ignore[assignment]
 
 try:
     # Optional import, only used for provider auto-detection
@@ -33,7 +73,24 @@ OPTIONAL_MODELS = {
     m.strip().lower() for m in os.getenv("ORATIO_OPTIONAL_MODELS", "kokoro").split(",") if m.strip()
 }
 SKIP_KOKORO = "kokoro" in OPTIONAL_MODELS
-VOICE_REF_MODELS = ("xtts", "f5-tts", "cosyvoice")
+# Let the hf-inference provider answer repeated requests from its cache.
+HF_USE_CACHE = os.getenv("ORATIO_HF_USE_CACHE", "1") != "0"
+# Older huggingface_hub releases do not expose use_cache on text_to_speech.
+_TTS_ACCEPTS_USE_CACHE = "use_cache" in inspect.signature(InferenceClient.text_to_speech).parameters
+# Dynamic batching of concurrent local Parler requests (0 = disabled).
+BATCH_WINDOW_SECONDS = max(0.0, float(os.getenv("ORATIO_TTS_BATCH_WINDOW_MS", "0"))) / 1000
+MAX_BATCH = max(1, int(os.getenv("ORATIO_TTS_MAX_BATCH", "8")))
+# Loaded local models kept in memory per cache (0 = no limit); least recently used go first.
+MODEL_CACHE_SIZE = max(0, int(os.getenv("ORATIO_TTS_MODEL_CACHE", "0")))
+# Intra-op threads for local models (0 = torch's default, capped to the CPUs we may use).
+TORCH_THREADS = max(0, int(os.getenv("ORATIO_TTS_THREADS", "0")))
+# Run fp32 SpeechT5/MMS under bf16 autocast on CPUs with native bf16 (AVX512-BF16/AMX).
+CPU_AUTOCAST = os.getenv("ORATIO_TTS_CPU_AUTOCAST", "1") != "0"
+# How long an "auto" provider decision is reused before looking at the models again.
+PROVIDER_CACHE_SECONDS = 5.0
+_UTC = timezone.utc
+# Model families that cannot render without a voice_ref clip.
+VOICE_REF_MODELS = frozenset({"xtts", "f5-tts", "cosyvoice"})
 
 ALL_VOICE_PRESETS = [
     VoicePreset(
@@ -111,7 +168,40 @@ ALL_VOICE_PRESETS = [
 VOICE_PRESETS = [
     voice for voice in ALL_VOICE_PRESETS if not (SKIP_KOKORO and "kokoro" in voice.model.lower())
 ]
-VOICE_BY_ID: Dict[str, VoicePreset] = {voice.id: voice for voice in VOICE_PRESETS}
+VOICE_BY_ID: Mapping[str, VoicePreset] = MappingProxyType({voice.id: voice for voice in VOICE_PRESETS})
+# Presets are fixed at import: serialize them once (treat as read-only).
+VOICES_PAYLOAD: Tuple[Dict[str, Any], ...] = tuple(asdict(voice) for voice in VOICE_PRESETS)
+
+# Model families, by repo id substring, checked in order.
+_FAMILY_MARKERS = (
+    ("parler", ("parler-tts",)),
+    ("bark", ("bark",)),
+    ("speecht5", ("speecht5",)),
+    ("xtts", ("xtts",)),
+    ("f5-tts", ("f5-tts", "f5_tts")),
+    ("cosyvoice", ("cosyvoice",)),
+    ("mms", ("mms-tts", "mms_tts")),
+    ("kokoro", ("kokoro",)),
+)
+# Families whose takes differ a lot between runs (token/noise sampling): they are
+# never served from the audio cache, each request gets a new take. SpeechT5 is not
+# bit-exact either (its decoder prenet keeps dropout on in eval mode), but takes
+# only vary slightly: the cache deliberately pins the first one.
+SAMPLING_FAMILIES = frozenset({"parler", "bark", "mms"})
+# Local handlers that take a voice_ref argument.
+VOICE_REF_FAMILIES = frozenset({"speecht5", "xtts", "f5-tts", "cosyvoice"})
+
+
+@functools.lru_cache(maxsize=None)
+def _model_family(model_id: str) -> Optional[str]:
+    lower_id = model_id.lower()
+    for family, markers in _FAMILY_MARKERS:
+        if any(marker in lower_id for marker in markers):
+            return family
+    return None
+
+
+VOICE_FAMILY: Dict[str, Optional[str]] = {voice.id: _model_family(voice.model) for voice in VOICE_PRESETS}
 
 
 @dataclass
@@ -132,6 +222,451 @@ def _is_audio_file(path: Path) -> bool:
     return path.suffix.lower() in AUDIO_EXTENSIONS
 
 
+def _is_regular_file(path: Path) -> bool:
+    """exists() and is_file() with a single stat() call."""
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
+
+
+def _wav_layout(audio_bytes: bytes) -> Optional[Tuple[int, int, int, int]]:
+    """
+    ``(fmt offset, sample rate, block align, data size)`` read from a RIFF/WAVE
+    header without decoding anything, or None when the chunks are not found.
+    """
+    if audio_bytes[:4] != b"RIFF" or audio_bytes[8:12] != b"WAVE":
+        return None
+    fmt = None
+    pos = 12
+    while pos + 8 <= len(audio_bytes):
+        chunk_id, size = struct.unpack_from("<4sI", audio_bytes, pos)
+        if chunk_id == b"fmt " and pos + 24 <= len(audio_bytes):
+            sample_rate, _, block_align = struct.unpack_from("<IIH", audio_bytes, pos + 12)
+            fmt = (pos, sample_rate, block_align)
+        elif chunk_id == b"data" and fmt is not None and fmt[1] and fmt[2]:
+            # Streamed WAVs may leave the size unset: trust the payload length then.
+            return (*fmt, min(size, len(audio_bytes) - pos - 8))
+        pos += 8 + size + (size & 1)  # chunks are word aligned
+    return None
+
+
+def _write_buffers(destination: Path, buffers: List[Any]) -> None:
+    """Write buffers back to back without joining them (one writev() on POSIX)."""
+    if not hasattr(os, "writev"):
+        with destination.open("wb") as fh:
+            fh.writelines(buffers)
+        return
+    views = [memoryview(buffer).cast("B") for buffer in buffers]
+    fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        while views:
+            written = os.writev(fd, views)
+            while views and written >= len(views[0]):
+                written -= len(views.pop(0))
+            if views and written:
+                views[0] = views[0][written:]
+    finally:
+        os.close(fd)
+
+
+def _write_pcm_wav(
+    destination: Path, pcm: Any, sample_rate: int, channels: int = 1, sampwidth: int = 2
+) -> None:
+    """Write a PCM WAV file (44-byte RIFF header + data); ``pcm`` is any buffer."""
+    header = _wav_header(memoryview(pcm).nbytes, sample_rate, channels, sampwidth)
+    _write_buffers(destination, [header, pcm])
+
+
+def _wav_header(size: int, sample_rate: int, channels: int = 1, sampwidth: int = 2) -> bytes:
+    """44-byte RIFF/WAVE header for ``size`` bytes of PCM data."""
+    block_align = channels * sampwidth
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,  # WAVE_FORMAT_PCM
+        channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        sampwidth * 8,
+        b"data",
+        size,
+    )
+
+
+def _build_stub_kernel():
+    """Compile the stub tone loop with numba; None when numba is not installed."""
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(cache=True, parallel=True, fastmath=True, boundscheck=False)
+    def kernel(out, step, scale):
+        # Samples are independent: split the range across cores.
+        for i in prange(out.shape[0]):
+            out[i] = int(scale * math.sin(step * i))
+
+    # Compile and start numba's thread pool here, on the importing thread: a pool
+    # first launched from a server worker thread hangs interpreter shutdown.
+    kernel(np.empty(1, dtype=np.int16), 0.0, 0.0)
+    return kernel
+
+
+# Opt-in: importing numba and compiling the kernel costs more than it saves for
+# the short, already cached stub tones unless the stub is hammered.
+_stub_kernel = (
+    _build_stub_kernel() if np is not None and os.getenv("ORATIO_USE_NUMBA", "0") == "1" else None
+)
+
+
+def _stub_tone(frame_count: int, sample_rate: int) -> bytes:
+    """16-bit mono PCM of the 440 Hz stub tone, ``frame_count`` frames long."""
+    frequency = 440.0
+    amplitude = 0.2
+    if _stub_kernel is not None and np is not None:
+        out = np.empty(frame_count, dtype="<i2")
+        _stub_kernel(out, 2 * math.pi * frequency / sample_rate, amplitude * 32767)
+        return out.tobytes()
+    if frame_count <= 0:
+        return b""
+    # 440 Hz repeats exactly every sample_rate / gcd(440, sample_rate) frames (600
+    # at 24 kHz): build that one-period wavetable and repeat it.
+    period = min(frame_count, sample_rate // math.gcd(int(frequency), sample_rate))
+    step = 2 * math.pi * frequency / sample_rate
+    if np is not None:
+        t = np.arange(period, dtype=np.float64)
+        cycle = (amplitude * 32767 * np.sin(step * t)).astype("<i2").tobytes()
+    else:
+        samples = array.array(
+            "h", (int(amplitude * 32767 * math.sin(step * i)) for i in range(period))
+        )
+        if sys.byteorder == "big":
+            samples.byteswap()
+        cycle = samples.tobytes()
+    repeats = -(-frame_count // period)
+    return (cycle * repeats)[: frame_count * 2]
+
+
+STUB_SAMPLE_RATE = 24_000
+STUB_MAX_SECONDS = 5.0
+
+# Longest stub tone rendered so far, per sample rate. Every stub clip is a prefix of
+# the same tone, so any length is served by slicing, whatever the text or speed.
+_STUB_TONES: Dict[int, bytes] = {}
+# _write_array_to_wav converts and writes this many frames at a time (512 KiB of
+# int16), through a per-thread buffer: TTS workers are threads.
+_PCM_BLOCK = 1 << 18
+_PCM_SCRATCH = threading.local()
+
+
+def _pcm_block():
+    """This thread's reusable int16 block buffer."""
+    buffer = getattr(_PCM_SCRATCH, "buffer", None)
+    if buffer is None or len(buffer) != _PCM_BLOCK:
+        buffer = _PCM_SCRATCH.buffer = np.empty(_PCM_BLOCK, dtype=np.int16)
+    return buffer
+
+
+def _stub_pcm(frame_count: int, sample_rate: int = STUB_SAMPLE_RATE) -> bytes:
+    tone = _STUB_TONES.get(sample_rate, b"")
+    if not tone or len(tone) < frame_count * 2:
+        # The first render covers every clip at speed >= 1; slower clips grow the tone
+        # geometrically so a run of slightly longer ones renders only a few times.
+        frames = max(frame_count, 2 * (len(tone) // 2), int(STUB_MAX_SECONDS * sample_rate))
+        tone = _stub_tone(frames, sample_rate)
+        _STUB_TONES[sample_rate] = tone
+    return tone[: frame_count * 2]
+
+
+@functools.lru_cache(maxsize=None)
+def _configure_hf_http() -> None:
+    """
+    Give requests-based huggingface_hub releases a pooled, retrying session.
+
+    InferenceClients already share the hub's per-thread session; this only widens
+    its connection pool so concurrent jobs keep their TLS connections alive. Newer
+    httpx-based releases pool connections in their global client and are left as is.
+    """
+    try:
+        from huggingface_hub import configure_http_backend
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+    except ImportError:
+        return
+
+    def backend_factory() -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            # Also retry gateway errors; inference is idempotent, so POSTs are retried too.
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=None,
+                raise_on_status=False,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    configure_http_backend(backend_factory=backend_factory)
+
+
+_VOICE_REF_KWARGS = (
+    "speaker_wav", "prompt_wav", "ref_audio", "reference_audio", "voice", "audio_prompt"
+)
+_PROMPT_KWARGS = ("prompt_text", "ref_text", "reference_text", "style")
+
+
+def _pipeline_call_shapes(
+    tts: Any, has_voice: bool, has_prompt: bool, has_speed: bool
+) -> List[Tuple[Optional[str], Optional[str], bool]]:
+    """
+    ``(voice kwarg, prompt kwarg, inside forward_params)`` shapes to try, in order.
+
+    Names a callable's explicit signature cannot accept are skipped up front;
+    HF pipelines take ``**kwargs`` and only reject unknown names when called.
+    """
+    accepted: Optional[frozenset] = None
+    try:
+        params = inspect.signature(tts).parameters
+    except (TypeError, ValueError):
+        params = None
+    if params is not None and not any(p.kind is p.VAR_KEYWORD for p in params.values()):
+        accepted = frozenset(params)
+
+    voice_names = _VOICE_REF_KWARGS if has_voice else (None,)
+    prompt_names = _PROMPT_KWARGS if has_prompt else (None,)
+    shapes = [
+        (voice, prompt, False)
+        for voice in voice_names
+        for prompt in prompt_names
+        if accepted is None or {voice, prompt} - {None} <= accepted
+    ]
+    if (has_voice or has_prompt) and has_speed:
+        shapes += [(voice, prompt, True) for voice in voice_names for prompt in prompt_names]
+    if has_speed:
+        shapes.append((None, None, False))  # last resort: speed only, extras dropped
+    return list(dict.fromkeys(shapes))
+
+
+def _bucket_length(length: int, smallest: int = 32, largest: int = 512) -> int:
+    """Next power of two >= ``length``, clamped to [smallest, largest] (never shorter)."""
+    bucket = min(max(smallest, 1 << max(length - 1, 0).bit_length()), largest)
+    return max(bucket, length)
+
+
+def _pad_to_bucket(inputs: Mapping[str, Any], pad_id: int) -> Dict[str, Any]:
+    """
+    Right-pad ``input_ids`` (and a matching ``attention_mask``) to a bucketed length.
+
+    Compiled models specialize on input shapes: a handful of buckets keeps them
+    from recompiling (and recording a new CUDA graph) for every text length.
+    """
+    import torch
+    import torch.nn.functional as F
+
+    input_ids = inputs["input_ids"]
+    mask = inputs.get("attention_mask")
+    if mask is None:
+        mask = torch.ones_like(input_ids)
+    pad = _bucket_length(input_ids.shape[-1]) - input_ids.shape[-1]
+    if pad:
+        input_ids = F.pad(input_ids, (0, pad), value=pad_id)
+        mask = F.pad(mask, (0, pad), value=0)
+    return {**inputs, "input_ids": input_ids, "attention_mask": mask}
+
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def _split_sentences(text: str) -> List[str]:
+    return [sentence for sentence in _SENTENCE_END.split(text.strip()) if sentence]
+
+
+def _crossfade_concat(segments: Sequence[Any], overlap: int):
+    """Join 1-D waveforms end to end, linearly blending ``overlap`` samples at each seam."""
+    out = np.empty(sum(len(segment) for segment in segments), dtype=np.float32)
+    pos = 0
+    for segment in segments:
+        n = min(overlap, pos, len(segment))
+        if n:
+            ramp = np.linspace(0.0, 1.0, n, dtype=np.float32)
+            seam = out[pos - n : pos]
+            seam *= 1.0 - ramp
+            seam += segment[:n] * ramp
+        out[pos : pos + len(segment) - n] = segment[n:]
+        pos += len(segment) - n
+    return out[:pos]
+
+
+def _to_device(value: Any, device: Any) -> Any:
+    """
+    Move a CPU tensor, or each tensor of a tokenizer output (in place), to ``device``.
+
+    GPU copies are staged through pinned memory and issued non-blocking, so the
+    transfer overlaps with work already queued on the stream.
+    """
+    if str(device) == "cpu":
+        return value
+    if isinstance(value, MutableMapping):
+        for key, item in value.items():
+            value[key] = _to_device(item, device)
+        return value
+    if hasattr(value, "pin_memory"):
+        return value.pin_memory().to(device, non_blocking=True)
+    return value
+
+
+def _cpu_budget() -> int:
+    """CPUs this process may run on: honours taskset/cpuset pinning where exposed."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # macOS, Windows
+        return os.cpu_count() or 1
+
+
+@functools.lru_cache(maxsize=1)
+def _configure_torch_threads() -> int:
+    """Size torch's CPU thread pools once per process; returns the intra-op count."""
+    import torch
+
+    # torch sizes its pool from the host's cores, ignoring a container's CPU pinning:
+    # more threads than usable CPUs just contend with each other.
+    threads = TORCH_THREADS or min(torch.get_num_threads(), _cpu_budget())
+    torch.set_num_threads(threads)
+    try:
+        # Inter-op parallelism only serves TorchScript forks; one thread avoids a
+        # second pool competing with the intra-op one.
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass  # can only be set before the first inter-op work
+    return threads
+
+
+@functools.lru_cache(maxsize=1)
+def _configure_dynamo() -> None:
+    """
+    Dynamo settings for compiled local models. They are process-wide (torch keeps
+    them in a global config), so they are applied once, when compilation is enabled.
+    """
+    try:
+        import torch
+    except ImportError:
+        return
+    if not hasattr(torch, "_dynamo"):
+        return
+    # Graph breaks or unsupported platforms fall back to eager execution.
+    torch._dynamo.config.suppress_errors = True
+    # Every text length is a new shape: allow more variants before giving up.
+    torch._dynamo.config.cache_size_limit = max(torch._dynamo.config.cache_size_limit, 64)
+
+
+# Heavy model classes, imported once per process. A failed import is not cached,
+# so installing a package is picked up on the next request.
+@functools.lru_cache(maxsize=1)
+def _parler_classes() -> Tuple[Any, Any]:
+    from parler_tts import ParlerTTSForConditionalGeneration
+    from transformers import AutoTokenizer
+
+    return ParlerTTSForConditionalGeneration, AutoTokenizer
+
+
+@functools.lru_cache(maxsize=1)
+def _speecht5_classes() -> Tuple[Any, Any, Any]:
+    from transformers import SpeechT5ForTextToSpeech, SpeechT5HifiGan, SpeechT5Processor
+
+    return SpeechT5Processor, SpeechT5ForTextToSpeech, SpeechT5HifiGan
+
+
+@functools.lru_cache(maxsize=1)
+def _vits_classes() -> Tuple[Any, Any]:
+    from transformers import AutoProcessor, VitsModel
+
+    return AutoProcessor, VitsModel
+
+
+@functools.lru_cache(maxsize=1)
+def _coqui_tts_class() -> Any:
+    from TTS.api import TTS
+
+    return TTS
+
+
+@functools.lru_cache(maxsize=None)
+def _local_support(model_id: str) -> Tuple[bool, Optional[str]]:
+    """Whether a model can run locally; installed packages do not change at runtime."""
+    lower_id = model_id.lower()
+    if "parler-tts" in lower_id:
+        try:
+            import parler_tts  # type: ignore  # noqa: F401
+        except Exception:
+            return False, "Parler local requiert le package parler-tts."
+        return True, None
+    if "bark" in lower_id:
+        try:
+            import transformers  # type: ignore  # noqa: F401
+        except Exception:
+            return False, "Bark local requiert transformers installe."
+        return True, None
+    if "speecht5" in lower_id:
+        try:
+            import torch  # type: ignore  # noqa: F401
+            from transformers import (  # type: ignore  # noqa: F401
+                SpeechT5ForTextToSpeech,
+                SpeechT5HifiGan,
+                SpeechT5Processor,
+            )
+        except Exception:
+            return False, "SpeechT5 local requiert torch + transformers installes."
+        return True, None
+    if "mms-tts" in lower_id or "mms_tts" in lower_id:
+        try:
+            import torch  # type: ignore  # noqa: F401
+            from transformers import AutoProcessor, VitsModel  # type: ignore  # noqa: F401
+        except Exception:
+            return False, "MMS local requiert torch + transformers installes."
+        return True, None
+    if "kokoro" in lower_id:
+        try:
+            import kokoro  # type: ignore  # noqa: F401
+        except Exception:
+            return False, "Kokoro local indisponible (package kokoro non supporte en Python 3.13); utilisez HF_TOKEN pour l'inference ou restez en stub."
+        return True, None
+    if "xtts" in lower_id:
+        try:
+            from TTS.api import TTS  # type: ignore  # noqa: F401
+        except Exception:
+            try:
+                import transformers  # type: ignore  # noqa: F401
+            except Exception:
+                return False, "XTTS local requiert TTS ou transformers installes."
+        return True, None
+    if "f5-tts" in lower_id or "f5_tts" in lower_id:
+        try:
+            import transformers  # type: ignore  # noqa: F401
+        except Exception:
+            return False, "F5-TTS local requiert transformers installe."
+        return True, None
+    if "cosyvoice" in lower_id:
+        try:
+            import transformers  # type: ignore  # noqa: F401
+        except Exception:
+            return False, "CosyVoice local requiert transformers installe."
+        return True, None
+    return True, None
+
+
 class TTSService:
     def __init__(
         self,
@@ -143,28 +678,65 @@ class TTSService:
         provider: str = "auto",  # "auto" | "inference" | "local" | "stub"
         models_dir: Optional[Path] = None,
         model_manager: Optional["ModelManager"] = None,
+        quantization: Optional[str] = None,  # None | "fp32" | "int8" | "bf16"
+        use_compile: bool = False,
+        device: Optional[str] = None,  # None = "cuda" when available, else "cpu"
+        cache_audio: bool = False,
     ) -> None:
         self.audio_dir = audio_dir
         self.base_audio_url = base_audio_url.rstrip("/")
         self.hf_token = hf_token
         self.use_stub = use_stub
+        if use_stub:
+            _stub_pcm(0, STUB_SAMPLE_RATE)  # render the tone now, not on the first request
         self.fallback_stub = fallback_stub
         self.provider = provider
         self.models_dir = models_dir
         self.model_manager = model_manager
-        self._clients: Dict[str, InferenceClient] = {}
-        self._local_pipelines: Dict[str, object] = {}
-        self._parler_models: Dict[str, Tuple[Any, Any]] = {}
+        self.quantization = (quantization or "").lower() or None
+        if self.quantization not in (None, "none", "fp32", "int8", "bf16"):
+            raise ValueError(f"Unknown quantization: {quantization}")
+        self.device = device
+        self.use_compile = use_compile
+        self._cpu_bf16: Optional[bool] = None  # probed on the first local forward
+        if use_compile and models_dir is not None:
+            # Inductor caches compiled graphs in a temp dir by default: keep them next
+            # to the models so a restart reuses them instead of recompiling for minutes.
+            os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", str(models_dir / ".inductor_cache"))
+        if use_compile:
+            _configure_dynamo()
+        # Content-addressed copies of model outputs, reused for identical requests.
+        self.audio_cache_dir: Optional[Path] = audio_dir / "cache" if cache_audio else None
+        self._client: Optional[InferenceClient] = None
+        self._async_client: Optional[AsyncInferenceClient] = None
+        self._local_pipelines: ModelCache[str, Any] = ModelCache(
+            MODEL_CACHE_SIZE, on_evict=self._forget_local_model
+        )
+        self._batchers: Dict[str, MicroBatcher] = {}
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self._parler_descriptions: Dict[str, Callable] = {}
+        # Keyword layout that last worked, per (pipeline id, voice?, prompt?, speed?).
+        self._pipeline_call_shapes: Dict[Tuple[int, bool, bool, bool], Tuple[Any, ...]] = {}
+        self._provider_cache: Dict[Optional[str], Tuple[float, str]] = {}
         self._speaker_encoder: Optional[object] = None
-        self._speaker_embeddings: Dict[str, Any] = {}
+        # (clip key, owning model path, placement) -> x-vector tensor.
+        self._speaker_embeddings: Dict[Tuple[str, Optional[str], Any], Any] = {}
+        self._local_handlers = {
+            "parler": self._synthesize_parler_local,
+            "bark": self._synthesize_bark_local,
+            "speecht5": self._synthesize_speecht5_local,
+            "xtts": self._synthesize_xtts_local,
+            "f5-tts": self._synthesize_voice_clone_pipeline_local,
+            "cosyvoice": self._synthesize_voice_clone_pipeline_local,
+            "mms": self._synthesize_mms_local,
+        }
         self.audio_dir.mkdir(parents=True, exist_ok=True)
 
-    def list_voices(self):
-        return [voice.__dict__ for voice in VOICE_PRESETS]
+    def list_voices(self) -> Tuple[Dict[str, Any], ...]:
+        return VOICES_PAYLOAD
 
     def _supports_voice_ref(self, model_id: str) -> bool:
-        lower_id = model_id.lower()
-        return any(token in lower_id for token in VOICE_REF_MODELS)
+        return _model_family(model_id) in VOICE_REF_MODELS
 
     def _resolve_voice_ref(self, voice_ref: Optional[str]) -> Optional[object]:
         if not voice_ref:
@@ -175,7 +747,7 @@ class TTSService:
         if trimmed.lower().startswith(("http://", "https://")):
             return trimmed
         candidate = Path(trimmed).expanduser()
-        if candidate.exists() and candidate.is_file():
+        if _is_regular_file(candidate):
             return candidate.read_bytes()
         return trimmed
 
@@ -188,26 +760,128 @@ class TTSService:
         if trimmed.lower().startswith(("http://", "https://")):
             raise RuntimeError("voice_ref local doit etre un chemin vers un fichier audio.")
         path = Path(trimmed).expanduser()
-        if not path.exists() or not path.is_file():
+        if not _is_regular_file(path):
             raise RuntimeError(f"voice_ref introuvable: {voice_ref}")
         if not _is_audio_file(path):
             raise RuntimeError(f"voice_ref doit etre un fichier audio (.wav, .mp3, .ogg, etc.), pas un fichier {path.suffix}")
         return path
 
     def _get_local_pipeline(self, model_key: str, task: str = "text-to-speech") -> object:
-        try:
-            from transformers import pipeline
-        except Exception as exc:  # noqa: BLE001
-            raise RuntimeError("Local pipeline requires transformers installed") from exc
+        pipe = self._local_pipelines.get(model_key)
+        if pipe is not None:
+            return pipe
+        with self._load_lock(model_key):
+            pipe = self._local_pipelines.get(model_key)
+            if pipe is not None:
+                return pipe
+            # transformers stays a lazy import: loading it costs seconds and stub or
+            # inference-only setups never need it. It is only touched on a cache miss.
+            try:
+                from transformers import pipeline
+            except Exception as exc:  # noqa: BLE001
+                raise RuntimeError("Local pipeline requires transformers installed") from exc
 
-        if model_key not in self._local_pipelines:
-            self._local_pipelines[model_key] = pipeline(
+            pipe = self._local_pipelines[model_key] = pipeline(
                 task=task,
                 model=model_key,
-                device="cpu",
+                device=self._device(),
                 trust_remote_code=True,
             )
-        return self._local_pipelines[model_key]
+            return pipe
+
+    def _load_lock(self, key: str) -> threading.Lock:
+        """
+        Per-model lock around loading: TTS workers are threads sharing this service,
+        so concurrent first requests must load one copy of the weights, not one each.
+        """
+        lock = self._load_locks.get(key)
+        if lock is None:
+            lock = self._load_locks.setdefault(key, threading.Lock())
+        return lock
+
+    def _forget_local_model(self, model_path: str, _model: Any) -> None:
+        """Drop the helpers holding an evicted model so the model can be freed."""
+        self._batchers.pop(model_path, None)
+        self._parler_descriptions.pop(model_path, None)
+        # Speaker x-vectors placed on this model's device (the .npy disk cache stays).
+        for key in [key for key in list(self._speaker_embeddings) if key[1] == model_path]:
+            self._speaker_embeddings.pop(key, None)
+
+    def _get_batcher(self, model_path: str, fn: Callable[[List[Any]], List[Any]]) -> MicroBatcher:
+        """
+        Micro-batcher for a local model; ``fn`` is bound to the loaded model itself so
+        an eviction never pulls the model from under a running batch.
+        """
+        batcher = self._batchers.get(model_path)
+        if batcher is None:
+            batcher = self._batchers.setdefault(
+                model_path, MicroBatcher(fn, max_batch=MAX_BATCH, window=BATCH_WINDOW_SECONDS)
+            )
+        return batcher
+
+    def _device(self) -> str:
+        if self.device is None:
+            try:
+                import torch
+
+                self.device = "cuda" if torch.cuda.is_available() else "cpu"
+            except Exception:  # noqa: BLE001
+                self.device = "cpu"
+        return self.device
+
+    def _load_kwargs(self) -> Dict[str, Any]:
+        """from_pretrained() arguments that load weights directly in the target precision."""
+        import torch
+
+        _configure_torch_threads()
+        # Loading in half precision never materializes the fp32 copy, halving peak RAM.
+        if self.quantization == "bf16":
+            return {"torch_dtype": torch.bfloat16}
+        if self.quantization in (None, "none") and self._device() != "cpu":
+            return {"torch_dtype": torch.float16}
+        return {}
+
+    def _cpu_autocast(self):
+        """bf16 autocast context for fp32 models on a bf16-capable CPU, a no-op otherwise."""
+        import torch
+
+        if self._cpu_bf16 is None:
+            supported = False
+            if CPU_AUTOCAST and self._device() == "cpu" and self.quantization in (None, "none"):
+                try:
+                    supported = bool(
+                        torch.backends.mkldnn.is_available()
+                        and torch.ops.mkldnn._is_mkldnn_bf16_supported()
+                    )
+                except Exception:  # noqa: BLE001 - older torch builds lack the probe
+                    supported = False
+            self._cpu_bf16 = supported
+        return torch.autocast("cpu", dtype=torch.bfloat16, enabled=self._cpu_bf16)
+
+    def _optimize_model(self, model, *, int8: bool = True):
+        """
+        Place the model and apply precision/compilation once, before it is cached.
+
+        ``int8=False`` keeps a module out of dynamic quantization (conv-only vocoders).
+        """
+        import torch
+
+        _configure_torch_threads()
+        device = self._device()
+        model = model.to(device)
+        if self.quantization == "bf16":
+            model = model.to(dtype=torch.bfloat16)
+        elif self.quantization == "int8" and device == "cpu" and int8:
+            # Dynamic int8 kernels only exist on CPU.
+            model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        elif self.quantization in (None, "none") and device != "cpu":
+            model = model.half()  # tensor cores; "fp32" keeps full precision on GPU
+        if self.use_compile and hasattr(torch, "compile"):
+            # Compile forward() only: generate() and the HF attributes stay on the module.
+            # CUDA graphs only pay off for a model that actually runs on the GPU.
+            mode = "reduce-overhead" if device != "cpu" else "default"
+            model.forward = torch.compile(model.forward, mode=mode, fullgraph=False)
+        return model
 
     def _run_tts_pipeline(
         self,
@@ -218,64 +892,42 @@ class TTSService:
         voice_ref_path: Optional[Path] = None,
         prompt_text: Optional[str] = None,
     ):
+        """
+        Call a pipeline whose voice/prompt keyword names are not known up front.
+
+        Candidate call shapes are tried in order until one binds; the winner is
+        remembered per pipeline and tried first on the next call.
+        """
         forward_params = {"speed": speed} if speed != 1.0 else {}
-        voice_candidates = []
-        if voice_ref_path is not None:
-            voice_path = str(voice_ref_path)
-            voice_candidates = [
-                {"speaker_wav": voice_path},
-                {"prompt_wav": voice_path},
-                {"ref_audio": voice_path},
-                {"reference_audio": voice_path},
-                {"voice": voice_path},
-                {"audio_prompt": voice_path},
-            ]
-        prompt_candidates = []
-        if prompt_text:
-            prompt_candidates = [
-                {"prompt_text": prompt_text},
-                {"ref_text": prompt_text},
-                {"reference_text": prompt_text},
-                {"style": prompt_text},
-            ]
-        if not voice_candidates and not prompt_candidates:
-            voice_candidates = [{}]
-            prompt_candidates = [{}]
-        elif not voice_candidates:
-            voice_candidates = [{}]
-        elif not prompt_candidates:
-            prompt_candidates = [{}]
+        has_extra = voice_ref_path is not None or bool(prompt_text)
+        key = (id(tts), voice_ref_path is not None, bool(prompt_text), bool(forward_params))
+        cached = self._pipeline_call_shapes.get(key)
+        shapes = _pipeline_call_shapes(tts, *key[1:])
+        if cached is not None:
+            shapes = [cached, *(shape for shape in shapes if shape != cached)]
 
         last_error = None
-        for voice_kwargs in voice_candidates:
-            for prompt_kwargs in prompt_candidates:
-                kwargs = {**voice_kwargs, **prompt_kwargs}
-                try:
-                    if forward_params:
-                        return tts(text, forward_params=forward_params, **kwargs)
-                    return tts(text, **kwargs)
-                except TypeError as exc:
-                    last_error = exc
-                    continue
-
-        if voice_ref_path is not None or prompt_text:
-            if forward_params:
-                for voice_kwargs in voice_candidates:
-                    for prompt_kwargs in prompt_candidates:
-                        merged = {**voice_kwargs, **prompt_kwargs}
-                        try:
-                            return tts(text, forward_params={**forward_params, **merged})
-                        except TypeError as exc:
-                            last_error = exc
-                            continue
-
-        if forward_params:
+        for shape in shapes:
+            voice_name, prompt_name, nested = shape
+            kwargs: Dict[str, Any] = {}
+            if voice_name:
+                kwargs[voice_name] = str(voice_ref_path)
+            if prompt_name:
+                kwargs[prompt_name] = prompt_text
             try:
-                return tts(text, forward_params=forward_params)
+                if nested:
+                    outputs = tts(text, forward_params={**forward_params, **kwargs})
+                elif forward_params:
+                    outputs = tts(text, forward_params=forward_params, **kwargs)
+                else:
+                    outputs = tts(text, **kwargs)
             except TypeError as exc:
                 last_error = exc
+                continue
+            self._pipeline_call_shapes[key] = shape
+            return outputs
 
-        if voice_ref_path is not None or prompt_text:
+        if has_extra:
             raise RuntimeError(
                 "Le modele local n'accepte pas voice_ref/prompt; verifiez les dependances."
             ) from last_error
@@ -297,10 +949,10 @@ class TTSService:
         if voice_id not in VOICE_BY_ID:
             raise ValueError(f"Unknown voice_id: {voice_id}")
 
-        job_id = job_id or str(uuid.uuid4())
+        job_id = job_id or uuid.uuid4().hex
         destination = self.audio_dir / f"{job_id}.wav"
         voice = VOICE_BY_ID[voice_id]
-        created_at = datetime.now(timezone.utc)
+        created_at = datetime.now(_UTC)
 
         resolved_provider = provider or self._resolve_provider(voice.model)
         use_stub = self.use_stub or resolved_provider == "stub"
@@ -337,9 +989,26 @@ class TTSService:
                 if not voice_ref or not voice_ref.strip():
                     raise ValueError("Ce modele requiert une reference de voix (voice_ref).")
 
+        cache_path = None
+        if not voice_ref:
+            cache_path = self._audio_cache_path(resolved_provider, voice, speed, style, text)
+        if cache_path is not None:
+            duration = self._copy_cached_audio(cache_path, destination)
+            if duration is not None:
+                return AudioResult(
+                    job_id=job_id,
+                    audio_path=destination,
+                    audio_url=f"{self.base_audio_url}/{destination.name}",
+                    duration_seconds=duration,
+                    created_at=created_at,
+                    model=voice.model,
+                    voice_id=voice_id,
+                    source=resolved_provider,
+                )
+
         try:
             if resolved_provider == "local":
-                return self._synthesize_local(
+                result = self._synthesize_local(
                     text=text,
                     voice=voice,
                     job_id=job_id,
@@ -349,8 +1018,10 @@ class TTSService:
                     voice_ref=voice_ref,
                     created_at=created_at,
                 )
+                self._store_cached_audio(destination, cache_path)
+                return result
             if resolved_provider == "inference":
-                return self._synthesize_inference(
+                result = self._synthesize_inference(
                     text=text,
                     voice=voice,
                     voice_ref=voice_ref_payload,
@@ -360,6 +1031,8 @@ class TTSService:
                     style=style,
                     created_at=created_at,
                 )
+                self._store_cached_audio(destination, cache_path)
+                return result
             duration = self._generate_stub_audio(text, destination, speed=speed)
             return AudioResult(
                 job_id=job_id,
@@ -386,10 +1059,187 @@ class TTSService:
                 source="stub",
             )
 
+    def _audio_cache_path(
+        self, provider: str, voice: VoicePreset, speed: float, style: Optional[str], text: str
+    ) -> Optional[Path]:
+        """Cache entry for a request, None when caching is off or the model samples."""
+        if self.audio_cache_dir is None or _model_family(voice.model) in SAMPLING_FAMILIES:
+            return None
+        parts = [provider, voice.id, voice.model]
+        if provider == "local":
+            # Same text, other weights or numerics: a re-download (new files, new dir
+            # mtime), a quantization mode or a device change all render differently.
+            model_path = self._resolve_model_path(voice.model)
+            try:
+                revision = str(os.stat(model_path).st_mtime_ns)
+            except OSError:
+                revision = ""
+            parts += [model_path, revision, self.quantization or "", self._device()]
+        parts += [repr(float(speed)), style or "", text]
+        key = hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+        return self.audio_cache_dir / f"{key}.wav"
+
+    @staticmethod
+    def _copy_cached_audio(cache_path: Path, destination: Path) -> Optional[float]:
+        """Copy a cached WAV to ``destination``; returns its duration, None on a miss."""
+        try:
+            # A copy, not a link: the job file and the cache entry never share an inode,
+            # so neither a rewrite nor the cleanup of one affects the other.
+            shutil.copyfile(cache_path, destination)
+            os.utime(cache_path)  # recently used: cleanup ages the entry from now
+            with wave.open(str(destination), "rb") as wav_in:
+                return wav_in.getnframes() / wav_in.getframerate()
+        except (OSError, EOFError, wave.Error):
+            destination.unlink(missing_ok=True)
+            return None
+
+    @staticmethod
+    def _store_cached_audio(destination: Path, cache_path: Optional[Path]) -> None:
+        if cache_path is None:
+            return
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+            shutil.copyfile(destination, tmp_path)
+            os.replace(tmp_path, cache_path)  # readers never see a partial entry
+        except OSError:
+            pass  # the cache is best effort
+
+    def synthesize_many(
+        self, requests: Iterable[Mapping[str, Any]], max_workers: int = 8
+    ) -> List[AudioResult]:
+        """
+        Run several :meth:`synthesize` calls concurrently, results in request order.
+
+        Inference requests overlap their HTTP round-trips; concurrent local Parler
+        requests are merged into one generate() when batching is enabled.
+        """
+        requests = list(requests)
+        if len(requests) <= 1:
+            return [self.synthesize(**request) for request in requests]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(requests))) as executor:
+            return list(executor.map(lambda request: self.synthesize(**request), requests))
+
+    def warm_up(self, voice_ids: Optional[Iterable[str]] = None) -> threading.Thread:
+        """
+        Load local models in a background thread by rendering a short sentence.
+
+        Defaults to every voice whose model is supported and present locally; failures
+        are ignored (the first real request reports them).
+        """
+        if voice_ids is None:
+            voice_ids = [voice.id for voice in VOICE_PRESETS]
+        # Cloning voices cannot render without a reference clip.
+        voices = [
+            VOICE_BY_ID[voice_id]
+            for voice_id in dict.fromkeys(voice_ids)
+            if voice_id in VOICE_BY_ID and not self._supports_voice_ref(VOICE_BY_ID[voice_id].model)
+        ]
+
+        def run() -> None:
+            with tempfile.TemporaryDirectory(prefix="oratio-warmup-") as tmp:
+                for voice in voices:
+                    if not self._has_local_models(voice.model):
+                        continue
+                    try:
+                        self._synthesize_local(
+                            text="Hello.",
+                            voice=voice,
+                            job_id=f"warmup-{voice.id}",
+                            destination=Path(tmp) / f"{voice.id}.wav",
+                            speed=1.0,
+                            style=None,
+                            voice_ref=None,
+                            created_at=datetime.now(_UTC),
+                        )
+                    except Exception:  # noqa: BLE001
+                        continue
+
+        thread = threading.Thread(target=run, name="oratio-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def preconnect(self) -> Optional[threading.Thread]:
+        """
+        Open the pooled HTTPS connection to the inference router in a background thread,
+        so the first request does not pay for DNS and the TLS handshake.
+        """
+        if self.use_stub or not self.hf_token or self.provider in {"local", "stub"}:
+            return None
+
+        def run() -> None:
+            self._get_client("")
+            url = INFERENCE_PROXY_TEMPLATE.format(provider="hf-inference")
+            try:
+                get_session().head(url, timeout=5)
+            except Exception:  # noqa: BLE001 - best effort, the first request reports errors
+                pass
+
+        thread = threading.Thread(target=run, name="oratio-preconnect", daemon=True)
+        thread.start()
+        return thread
+
+    async def asynthesize(
+        self,
+        *,
+        text: str,
+        voice_id: str,
+        speed: float = 1.0,
+        style: Optional[str] = None,
+        voice_ref: Optional[str] = None,
+        job_id: Optional[str] = None,
+        provider: Optional[str] = None,
+    ) -> AudioResult:
+        """
+        Async variant of :meth:`synthesize`.
+
+        Plain inference requests are awaited with AsyncInferenceClient; everything else
+        (local models, stub, voice cloning) runs :meth:`synthesize` in a worker thread.
+        """
+        voice = VOICE_BY_ID.get(voice_id)
+        if (
+            voice is not None
+            and not self.use_stub
+            and not voice_ref
+            and not self._supports_voice_ref(voice.model)
+            and VOICE_FAMILY.get(voice.id) != "bark"
+            and (provider or self._resolve_provider(voice.model)) == "inference"
+        ):
+            try:
+                return await self._asynthesize_inference(
+                    text=text,
+                    voice=voice,
+                    job_id=job_id or uuid.uuid4().hex,
+                    speed=speed,
+                    style=style,
+                )
+            except ImportError:
+                pass  # async HTTP backend (aiohttp on older hubs) missing: use the sync client
+            except Exception:
+                if not self.fallback_stub:
+                    raise
+                provider = "stub"
+        return await asyncio.to_thread(
+            self.synthesize,
+            text=text,
+            voice_id=voice_id,
+            speed=speed,
+            style=style,
+            voice_ref=voice_ref,
+            job_id=job_id,
+            provider=provider,
+        )
+
     def _get_client(self, model: str) -> InferenceClient:
-        if model not in self._clients:
-            self._clients[model] = InferenceClient(model=model, token=self.hf_token)
-        return self._clients[model]
+        # Every call passes model= explicitly, so one client serves all voices.
+        if self._client is None:
+            _configure_hf_http()
+            headers = {
+                "X-use-cache": "true" if HF_USE_CACHE else "false",
+                "X-wait-for-model": "true",  # queue while a cold model loads instead of a 503
+            }
+            self._client = InferenceClient(token=self.hf_token, headers=headers)
+        return self._client
 
     def _resolve_model_path(self, model_name: str) -> str:
         model_path = model_name
@@ -404,65 +1254,7 @@ class TTSService:
         return model_path
 
     def _local_support(self, model_id: str) -> Tuple[bool, Optional[str]]:
-        lower_id = model_id.lower()
-        if "parler-tts" in lower_id:
-            try:
-                import parler_tts  # type: ignore  # noqa: F401
-            except Exception:
-                return False, "Parler local requiert le package parler-tts."
-            return True, None
-        if "bark" in lower_id:
-            try:
-                import transformers  # type: ignore  # noqa: F401
-            except Exception:
-                return False, "Bark local requiert transformers installe."
-            return True, None
-        if "speecht5" in lower_id:
-            try:
-                import torch  # type: ignore  # noqa: F401
-                from transformers import (  # type: ignore  # noqa: F401
-                    SpeechT5ForTextToSpeech,
-                    SpeechT5HifiGan,
-                    SpeechT5Processor,
-                )
-            except Exception:
-                return False, "SpeechT5 local requiert torch + transformers installes."
-            return True, None
-        if "mms-tts" in lower_id or "mms_tts" in lower_id:
-            try:
-                import torch  # type: ignore  # noqa: F401
-                from transformers import AutoProcessor, VitsModel  # type: ignore  # noqa: F401
-            except Exception:
-                return False, "MMS local requiert torch + transformers installes."
-            return True, None
-        if "kokoro" in lower_id:
-            try:
-                import kokoro  # type: ignore  # noqa: F401
-            except Exception:
-                return False, "Kokoro local indisponible (package kokoro non supporte en Python 3.13); utilisez HF_TOKEN pour l'inference ou restez en stub."
-            return True, None
-        if "xtts" in lower_id:
-            try:
-                from TTS.api import TTS  # type: ignore  # noqa: F401
-            except Exception:
-                try:
-                    import transformers  # type: ignore  # noqa: F401
-                except Exception:
-                    return False, "XTTS local requiert TTS ou transformers installes."
-            return True, None
-        if "f5-tts" in lower_id or "f5_tts" in lower_id:
-            try:
-                import transformers  # type: ignore  # noqa: F401
-            except Exception:
-                return False, "F5-TTS local requiert transformers installe."
-            return True, None
-        if "cosyvoice" in lower_id:
-            try:
-                import transformers  # type: ignore  # noqa: F401
-            except Exception:
-                return False, "CosyVoice local requiert transformers installe."
-            return True, None
-        return True, None
+        return _local_support(model_id)
 
     def _supports_local_model(self, model_id: str) -> bool:
         supported, _ = self._local_support(model_id)
@@ -471,12 +1263,24 @@ class TTSService:
     def _resolve_provider(self, model_id: Optional[str] = None) -> str:
         if self.provider in {"local", "inference", "stub"}:
             return self.provider
-        # auto: prefer local models, then inference (token), else stub
+        # auto: checking local models hits the disk, so reuse recent answers
+        now = time.monotonic()
+        cached = self._provider_cache.get(model_id)
+        if cached is not None and now - cached[0] < PROVIDER_CACHE_SECONDS:
+            return cached[1]
+        # prefer local models, then inference (token), else stub
         if self._has_local_models(model_id):
-            return "local"
-        if self.hf_token:
-            return "inference"
-        return "stub"
+            resolved = "local"
+        elif self.hf_token:
+            resolved = "inference"
+        else:
+            resolved = "stub"
+        self._provider_cache[model_id] = (now, resolved)
+        return resolved
+
+    def refresh(self) -> None:
+        """Forget cached provider decisions (e.g. after models were downloaded)."""
+        self._provider_cache.clear()
 
     def current_provider(self) -> str:
         """Expose the provider resolved at runtime."""
@@ -486,23 +1290,14 @@ class TTSService:
         if model_id and not self._supports_local_model(model_id):
             return False
 
-        statuses = self.model_manager.status() if self.model_manager is not None else None
-        if statuses is not None:
+        if self.model_manager is not None:
             if model_id:
-                for status in statuses:
-                    if (
-                        status.exists
-                        and status.repo_id == model_id
-                        and self._supports_local_model(status.repo_id)
-                    ):
-                        return True
-                if (
-                    self.model_manager.resolve_model_path(model_id) is not None
-                    and self._supports_local_model(model_id)
-                ):
-                    return True
-                return False
-            return any(status.exists and self._supports_local_model(status.repo_id) for status in statuses)
+                # One lookup for this repo instead of a status() scan of every model.
+                return self.model_manager.resolve_model_path(model_id) is not None
+            return any(
+                status.exists and self._supports_local_model(status.repo_id)
+                for status in self.model_manager.status()
+            )
 
         if not self.models_dir:
             return False
@@ -529,37 +1324,38 @@ class TTSService:
         return None
 
     def _write_wav_bytes(self, audio_bytes: bytes, destination: Path, speed: float) -> float:
+        layout = _wav_layout(audio_bytes)
+        if layout is not None:
+            fmt_pos, framerate, block_align, data_size = layout
+            sample_rate = int(framerate * speed)
+            if speed == 1.0:
+                # Nothing to change: keep the payload as-is, only the header was read.
+                destination.write_bytes(audio_bytes)
+            else:
+                # Speed only changes the declared rate: splice the new fields in with one
+                # writev instead of re-encoding or copying the whole payload.
+                payload = memoryview(audio_bytes)
+                rates = struct.pack("<II", sample_rate, sample_rate * block_align)
+                _write_buffers(destination, [payload[: fmt_pos + 12], rates, payload[fmt_pos + 20 :]])
+            return data_size / (block_align * sample_rate)
+
         with wave.open(io.BytesIO(audio_bytes), "rb") as wav_in:
             params = wav_in.getparams()
             frames = wav_in.readframes(params.nframes)
 
         sample_rate = int(params.framerate * speed)
-        destination.parent.mkdir(parents=True, exist_ok=True)
-        with wave.open(str(destination), "wb") as wav_out:
-            wav_out.setnchannels(params.nchannels)
-            wav_out.setsampwidth(params.sampwidth)
-            wav_out.setframerate(sample_rate)
-            wav_out.writeframes(frames)
+        _write_pcm_wav(destination, frames, sample_rate, params.nchannels, params.sampwidth)
 
         duration = len(frames) / (params.sampwidth * params.nchannels * sample_rate)
         return duration
 
     def _generate_stub_audio(self, text: str, destination: Path, speed: float = 1.0) -> float:
-        sample_rate = 24_000
-        base_duration = max(1.0, min(5.0, len(text) / 20.0))
+        sample_rate = STUB_SAMPLE_RATE
+        base_duration = max(1.0, min(STUB_MAX_SECONDS, len(text) / 20.0))
         duration = base_duration / speed
-        frequency = 440.0
-        amplitude = 0.2
-
-        destination.parent.mkdir(parents=True, exist_ok=True)
-        with wave.open(str(destination), "w") as wav_file:
-            wav_file.setnchannels(1)
-            wav_file.setsampwidth(2)
-            wav_file.setframerate(sample_rate)
-            frame_count = int(sample_rate * duration)
-            for i in range(frame_count):
-                value = int(amplitude * 32767 * math.sin(2 * math.pi * frequency * i / sample_rate))
-                wav_file.writeframes(struct.pack("<h", value))
+
+        # Stub text lengths and speeds repeat a lot: reuse the cached tone.
+        _write_pcm_wav(destination, _stub_pcm(int(sample_rate * duration), sample_rate), sample_rate)
 
         return duration
 
@@ -576,19 +1372,65 @@ class TTSService:
         created_at: datetime,
     ) -> AudioResult:
         client = self._get_client(voice.model)
-        lower_model = voice.model.lower()
-        kwargs = {}
+        kwargs = self._inference_kwargs(voice, voice_ref, style)
+        if VOICE_FAMILY.get(voice.id) == "bark":
+            audio_bytes = client.text_to_audio(text, model=voice.model)
+        else:
+            audio_bytes = client.text_to_speech(text, model=voice.model, **kwargs)
+        duration = self._write_wav_bytes(audio_bytes, destination, speed=speed)
+        return AudioResult(
+            job_id=job_id,
+            audio_path=destination,
+            audio_url=f"{self.base_audio_url}/{destination.name}",
+            duration_seconds=duration,
+            created_at=created_at,
+            model=voice.model,
+            voice_id=voice.id,
+            source="inference",
+        )
+
+    @staticmethod
+    def _inference_kwargs(voice: VoicePreset, voice_ref: Optional[object], style: Optional[str]) -> dict:
+        kwargs: Dict[str, Any] = {}
         if voice_ref is not None:
             kwargs["voice"] = voice_ref
         elif voice.voice:
             kwargs["voice"] = voice.voice
         if style:
             kwargs["style"] = style
-        if "bark" in lower_model:
-            audio_bytes = client.text_to_audio(text, model=voice.model)
-        else:
-            audio_bytes = client.text_to_speech(text, model=voice.model, **kwargs)
-        duration = self._write_wav_bytes(audio_bytes, destination, speed=speed)
+        if HF_USE_CACHE and _TTS_ACCEPTS_USE_CACHE:
+            kwargs["use_cache"] = True
+        return kwargs
+
+    async def _asynthesize_inference(
+        self,
+        *,
+        text: str,
+        voice: VoicePreset,
+        job_id: str,
+        speed: float,
+        style: Optional[str],
+    ) -> AudioResult:
+        """Inference request awaited on the event loop; only the disk work uses a thread."""
+        destination = self.audio_dir / f"{job_id}.wav"
+        created_at = datetime.now(_UTC)
+        cache_path = self._audio_cache_path("inference", voice, speed, style, text)
+        duration = None
+        if cache_path is not None:
+            duration = await asyncio.to_thread(self._copy_cached_audio, cache_path, destination)
+        if duration is None:
+            if self._async_client is None:
+                headers = {
+                    "X-use-cache": "true" if HF_USE_CACHE else "false",
+                    "X-wait-for-model": "true",
+                }
+                self._async_client = AsyncInferenceClient(token=self.hf_token, headers=headers)
+            audio_bytes = await self._async_client.text_to_speech(
+                text, model=voice.model, **self._inference_kwargs(voice, None, style)
+            )
+            duration = await asyncio.to_thread(self._write_wav_bytes, audio_bytes, destination, speed)
+            if cache_path is not None:
+                await asyncio.to_thread(self._store_cached_audio, destination, cache_path)
         return AudioResult(
             job_id=job_id,
             audio_path=destination,
@@ -615,79 +1457,18 @@ class TTSService:
         model_path = self._resolve_model_path(voice.model)
         model_key = model_path
 
-        lower_model = voice.model.lower()
-        if "parler-tts" in lower_model:
-            return self._synthesize_parler_local(
-                text=text,
-                voice=voice,
-                job_id=job_id,
-                destination=destination,
-                speed=speed,
-                style=style,
-                created_at=created_at,
-                model_path=model_path,
-            )
-        if "bark" in lower_model:
-            return self._synthesize_bark_local(
-                text=text,
-                voice=voice,
-                job_id=job_id,
-                destination=destination,
-                speed=speed,
-                style=style,
-                created_at=created_at,
-                model_path=model_path,
-            )
-        if "speecht5" in lower_model:
-            return self._synthesize_speecht5_local(
-                text=text,
-                voice=voice,
-                job_id=job_id,
-                destination=destination,
-                speed=speed,
-                style=style,
-                voice_ref=voice_ref,
-                created_at=created_at,
-                model_path=model_path,
-            )
-        if "xtts" in lower_model:
-            return self._synthesize_xtts_local(
-                text=text,
-                voice=voice,
-                job_id=job_id,
-                destination=destination,
-                speed=speed,
-                style=style,
-                voice_ref=voice_ref,
-                created_at=created_at,
-                model_path=model_path,
-            )
-        if "f5-tts" in lower_model or "f5_tts" in lower_model:
-            return self._synthesize_voice_clone_pipeline_local(
-                text=text,
-                voice=voice,
-                job_id=job_id,
-                destination=destination,
-                speed=speed,
-                style=style,
-                voice_ref=voice_ref,
-                created_at=created_at,
-                model_path=model_path,
-            )
-        if "cosyvoice" in lower_model:
-            return self._synthesize_voice_clone_pipeline_local(
-                text=text,
-                voice=voice,
-                job_id=job_id,
-                destination=destination,
-                speed=speed,
-                style=style,
-                voice_ref=voice_ref,
-                created_at=created_at,
-                model_path=model_path,
+        family = VOICE_FAMILY.get(voice.id) or _model_family(voice.model)
+        if family == "kokoro":
+            raise RuntimeError(
+                "Local Kokoro inference requires the kokoro package; "
+                "install it or use ORATIO_TTS_PROVIDER=inference/stub."
             )
-        if "mms-tts" in lower_model or "mms_tts" in lower_model:
-            return self._synthesize_mms_local(
+        handler = self._local_handlers.get(family)
+        if handler is not None:
+            options: Dict[str, Any] = {}
+            if family in VOICE_REF_FAMILIES:
+                options["voice_ref"] = voice_ref
+            return handler(
                 text=text,
                 voice=voice,
                 job_id=job_id,
@@ -696,11 +1477,7 @@ class TTSService:
                 style=style,
                 created_at=created_at,
                 model_path=model_path,
-            )
-        if "kokoro" in lower_model:
-            raise RuntimeError(
-                "Local Kokoro inference requires the kokoro package; "
-                "install it or use ORATIO_TTS_PROVIDER=inference/stub."
+                **options,
             )
 
         tts = self._get_local_pipeline(model_key, task="text-to-speech")
@@ -734,26 +1511,38 @@ class TTSService:
     ) -> AudioResult:
         try:
             import torch
-            from parler_tts import ParlerTTSForConditionalGeneration
-            from transformers import AutoTokenizer
+            ParlerTTSForConditionalGeneration, AutoTokenizer = _parler_classes()
         except Exception as exc:  # noqa: BLE001
             raise RuntimeError("Parler-TTS local mode requires the parler-tts package installed") from exc
 
-        if model_path not in self._parler_models:
-            model = ParlerTTSForConditionalGeneration.from_pretrained(model_path).to("cpu")
-            model.eval()
-            tokenizer = AutoTokenizer.from_pretrained(model_path)
-            self._parler_models[model_path] = (model, tokenizer)
-        model, tokenizer = self._parler_models[model_path]
+        with self._load_lock(model_path):
+            entry = self._local_pipelines.get(model_path)
+            if entry is None:
+                # SDPA gives the decoder fused attention kernels (the role BetterTransformer
+                # used to play); SpeechT5 and VITS do not support it and keep eager attention.
+                model = ParlerTTSForConditionalGeneration.from_pretrained(
+                    model_path, attn_implementation="sdpa", **self._load_kwargs()
+                )
+                model.eval()
+                model = self._optimize_model(model)
+                tokenizer = AutoTokenizer.from_pretrained(model_path)
+                entry = self._local_pipelines[model_path] = (model, tokenizer)
+            model, tokenizer = entry
 
-        device = next(model.parameters()).device
         description = style or "Neutral speaker, clear voice, studio quality."
-        desc_ids = tokenizer(description, return_tensors="pt").input_ids.to(device)
-        prompt_ids = tokenizer(text, return_tensors="pt").input_ids.to(device)
+        if BATCH_WINDOW_SECONDS > 0:
+            batcher = self._get_batcher(
+                model_path, functools.partial(self._parler_generate_batch, model, tokenizer)
+            )
+            waveform = batcher.submit((description, text))
+        else:
+            device = next(model.parameters()).device
+            desc_ids = self._parler_description_ids(model_path, tokenizer, device)(description)
+            prompt_ids = _to_device(tokenizer(text, return_tensors="pt").input_ids, device)
 
-        with torch.inference_mode():
-            audio = model.generate(input_ids=desc_ids, prompt_input_ids=prompt_ids)
-        waveform = audio.cpu().numpy().squeeze()
+            with torch.inference_mode():
+                audio = model.generate(input_ids=desc_ids, prompt_input_ids=prompt_ids)
+            waveform = audio.float().cpu().numpy().squeeze()
         duration = self._write_array_to_wav(waveform, model.config.sampling_rate, destination)
         return AudioResult(
             job_id=job_id,
@@ -766,6 +1555,48 @@ class TTSService:
             source="local",
         )
 
+    def _parler_description_ids(self, model_path: str, tokenizer: Any, device: Any) -> Callable:
+        """
+        Per-model memo of description token ids, already on the model's device.
+
+        Most requests use the default description (or one of a few styles), so its
+        tokenization and host-to-device copy happen once instead of per request.
+        """
+        encode = self._parler_descriptions.get(model_path)
+        if encode is None:
+
+            @functools.lru_cache(maxsize=64)
+            def encode(description: str):
+                return tokenizer(description, return_tensors="pt").input_ids.to(device)
+
+            self._parler_descriptions[model_path] = encode
+        return encode
+
+    def _parler_generate_batch(
+        self, model: Any, tokenizer: Any, items: List[Tuple[str, str]]
+    ) -> List[Any]:
+        """Run one padded Parler generate() for several (description, text) pairs."""
+        import torch
+
+        device = next(model.parameters()).device
+        descriptions = tokenizer([d for d, _ in items], return_tensors="pt", padding=True)
+        prompts = tokenizer([t for _, t in items], return_tensors="pt", padding=True)
+        descriptions, prompts = _to_device(descriptions, device), _to_device(prompts, device)
+
+        with torch.inference_mode():
+            generation = model.generate(
+                input_ids=descriptions.input_ids,
+                attention_mask=descriptions.attention_mask,
+                prompt_input_ids=prompts.input_ids,
+                prompt_attention_mask=prompts.attention_mask,
+                return_dict_in_generate=True,
+            )
+        sequences = generation.sequences.cpu()
+        return [
+            sequences[i, : generation.audios_length[i]].float().numpy().squeeze()
+            for i in range(len(items))
+        ]
+
     def _synthesize_bark_local(
         self,
         *,
@@ -778,20 +1609,23 @@ class TTSService:
         created_at: datetime,
         model_path: str,
     ) -> AudioResult:
-        try:
-            from transformers import pipeline
-        except Exception as exc:  # noqa: BLE001
-            raise RuntimeError("Bark local mode requires transformers installed") from exc
-
         model_key = model_path
-        if model_key not in self._local_pipelines:
-            self._local_pipelines[model_key] = pipeline(
-                task="text-to-audio",
-                model=model_key,
-                device="cpu",
-                trust_remote_code=True,
-            )
-        bark = self._local_pipelines[model_key]
+        with self._load_lock(model_key):
+            bark = self._local_pipelines.get(model_key)
+            if bark is None:
+                try:
+                    from transformers import pipeline
+                except Exception as exc:  # noqa: BLE001
+                    raise RuntimeError("Bark local mode requires transformers installed") from exc
+
+                bark_pipeline = pipeline(
+                    task="text-to-audio",
+                    model=model_key,
+                    device=self._device(),
+                    trust_remote_code=True,
+                )
+                bark_pipeline.model = self._optimize_model(bark_pipeline.model)
+                bark = self._local_pipelines[model_key] = bark_pipeline
         outputs = bark(text)
         audio = outputs["audio"] if isinstance(outputs, dict) else outputs
         sampling_rate = outputs.get("sampling_rate", 22050) if isinstance(outputs, dict) else 22050
@@ -823,37 +1657,36 @@ class TTSService:
         voice_ref_path = self._resolve_local_voice_ref_path(voice_ref, required=True)
         xtts_error: Optional[Exception] = None
         try:
-            from TTS.api import TTS
-
+            TTS = _coqui_tts_class()
             model_key = f"xtts::{model_path}"
-            if model_key not in self._local_pipelines:
-                model_dir = Path(model_path)
-                tts_model = None
-                if model_dir.exists() and model_dir.is_dir():
-                    config_path = model_dir / "config.json"
-                    checkpoint = model_dir / "model.pth"
-                    if not checkpoint.exists():
-                        candidates = [
-                            p
-                            for p in model_dir.glob("*.pth")
-                            if "speaker" not in p.name.lower()
-                        ]
-                        if candidates:
-                            checkpoint = candidates[0]
-                    if config_path.exists() and checkpoint.exists():
-                        tts_model = TTS(
-                            model_path=str(checkpoint),
-                            config_path=str(config_path),
-                            progress_bar=False,
-                            gpu=False,
-                        )
+            with self._load_lock(model_key):
+                tts_model = self._local_pipelines.get(model_key)
+                if tts_model is None:
+                    model_dir = Path(model_path)
+                    use_gpu = self._device() != "cpu"
+                    if model_dir.exists() and model_dir.is_dir():
+                        config_path = model_dir / "config.json"
+                        checkpoint = model_dir / "model.pth"
+                        if not checkpoint.exists():
+                            candidates = [
+                                p
+                                for p in model_dir.glob("*.pth")
+                                if "speaker" not in p.name.lower()
+                            ]
+                            if candidates:
+                                checkpoint = candidates[0]
+                        if config_path.exists() and checkpoint.exists():
+                            tts_model = TTS(
+                                model_path=str(checkpoint),
+                                config_path=str(config_path),
+                                progress_bar=False,
+                                gpu=use_gpu,
+                            )
+                        else:
+                            tts_model = TTS(model_path=str(model_dir), progress_bar=False, gpu=use_gpu)
                     else:
-                        tts_model = TTS(model_path=str(model_dir), progress_bar=False, gpu=False)
-                else:
-                    tts_model = TTS(model_name=voice.model, progress_bar=False, gpu=False)
-                self._local_pipelines[model_key] = tts_model
-
-            tts_model = self._local_pipelines[model_key]
+                        tts_model = TTS(model_name=voice.model, progress_bar=False, gpu=use_gpu)
+                    self._local_pipelines[model_key] = tts_model
             language = voice.language if voice.language != "multi" else os.getenv("ORATIO_TTS_LANGUAGE", "en")
             audio = tts_model.tts(
                 text=text,
@@ -928,7 +1761,14 @@ class TTSService:
             source="local",
         )
 
-    def _resolve_speecht5_embedding(self, voice_ref: str):
+    def _resolve_speecht5_embedding(
+        self, voice_ref: str, like: Any = None, owner: Optional[str] = None
+    ):
+        """
+        x-vector for a reference clip. With ``like`` (a tensor), it is cached already
+        on that tensor's device and dtype, so requests reuse it without a copy; the
+        ``owner`` model path lets an eviction of that model drop the placed copies.
+        """
         try:
             import torch
             import torchaudio
@@ -937,12 +1777,31 @@ class TTSService:
             raise RuntimeError("SpeechT5 voice_ref requiert torchaudio installe.") from exc
 
         path = Path(voice_ref).expanduser()
-        if not path.exists():
-            raise RuntimeError(f"voice_ref introuvable: {voice_ref}")
-        cache_key = str(path.resolve())
-        cached = self._speaker_embeddings.get(cache_key)
+        try:
+            st = path.stat()
+        except OSError:
+            raise RuntimeError(f"voice_ref introuvable: {voice_ref}") from None
+        # Size and mtime in the key: an edited reference clip gets a new embedding.
+        cache_key = f"{path.resolve()}:{st.st_size}:{st.st_mtime_ns}"
+        memo_key = (cache_key, owner, None if like is None else (like.device, like.dtype))
+        cached = self._speaker_embeddings.get(memo_key)
         if cached is not None:
             return cached
+        # The x-vector is a pure function of the clip: keep it on disk across restarts.
+        disk_path = self.audio_dir / "cache" / "xvectors" / (
+            hashlib.sha256(cache_key.encode("utf-8")).hexdigest()[:32] + ".npy"
+        )
+        if np is not None:
+            try:
+                embedding = torch.from_numpy(np.load(disk_path))
+                os.utime(disk_path)  # recently used: cleanup ages the file from now
+            except (OSError, ValueError):
+                pass
+            else:
+                if like is not None:
+                    embedding = embedding.to(like.device, dtype=like.dtype)
+                self._speaker_embeddings[memo_key] = embedding
+                return embedding
 
         waveform, sample_rate = torchaudio.load(str(path))
         if waveform.ndim > 1 and waveform.shape[0] > 1:
@@ -951,9 +1810,10 @@ class TTSService:
         if sample_rate != target_rate:
             waveform = torchaudio.functional.resample(waveform, sample_rate, target_rate)
 
-        if self._speaker_encoder is None:
-            self._speaker_encoder = SUPERB_XVECTOR.get_model()
-            self._speaker_encoder.eval()
+        with self._load_lock("xvector"):
+            if self._speaker_encoder is None:
+                self._speaker_encoder = SUPERB_XVECTOR.get_model()
+                self._speaker_encoder.eval()
 
         with torch.inference_mode():
             embedding = self._speaker_encoder(waveform)
@@ -965,7 +1825,18 @@ class TTSService:
             embedding = embedding.squeeze()
             if embedding.ndim == 1:
                 embedding = embedding.unsqueeze(0)
-        self._speaker_embeddings[cache_key] = embedding
+        if np is not None:
+            try:
+                disk_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = disk_path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+                with tmp_path.open("wb") as fh:
+                    np.save(fh, embedding.float().cpu().numpy())
+                os.replace(tmp_path, disk_path)
+            except OSError:
+                pass  # the disk cache is best effort
+        if like is not None:
+            embedding = embedding.to(like.device, dtype=like.dtype)
+        self._speaker_embeddings[memo_key] = embedding
         return embedding
 
     def _synthesize_speecht5_local(
@@ -983,42 +1854,58 @@ class TTSService:
     ) -> AudioResult:
         try:
             import torch
-            from transformers import SpeechT5ForTextToSpeech, SpeechT5HifiGan, SpeechT5Processor
+            SpeechT5Processor, SpeechT5ForTextToSpeech, SpeechT5HifiGan = _speecht5_classes()
         except Exception as exc:  # noqa: BLE001
             raise RuntimeError("SpeechT5 local mode requires transformers installed") from exc
 
-        if model_path not in self._local_pipelines:
-            vocoder_path = self._resolve_model_path("microsoft/speecht5_hifigan")
-            processor = SpeechT5Processor.from_pretrained(model_path)
-            model = SpeechT5ForTextToSpeech.from_pretrained(model_path)
-            vocoder = SpeechT5HifiGan.from_pretrained(vocoder_path)
-            self._local_pipelines[model_path] = (processor, model, vocoder)
-        processor, model, vocoder = self._local_pipelines[model_path]
+        with self._load_lock(model_path):
+            entry = self._local_pipelines.get(model_path)
+            if entry is None:
+                vocoder_path = self._resolve_model_path("microsoft/speecht5_hifigan")
+                processor = SpeechT5Processor.from_pretrained(model_path)
+                load_kwargs = self._load_kwargs()
+                model = SpeechT5ForTextToSpeech.from_pretrained(model_path, **load_kwargs)
+                vocoder = SpeechT5HifiGan.from_pretrained(vocoder_path, **load_kwargs)
+                model = self._optimize_model(model.eval())
+                # HiFi-GAN is all convolutions: dynamic int8 has nothing to gain there.
+                vocoder = self._optimize_model(vocoder.eval(), int8=False)
+                # Neutral speaker embedding, allocated once on the model's device/dtype
+                # and stored with the model so an eviction frees both.
+                zero_spk = torch.zeros((1, 512), dtype=model.dtype, device=model.device)
+                entry = self._local_pipelines[model_path] = (processor, model, vocoder, zero_spk)
+            processor, model, vocoder, zero_spk = entry
 
-        inputs = processor(text=text, return_tensors="pt")
         if voice_ref:
             voice_ref_path = self._resolve_local_voice_ref_path(voice_ref, required=True)
-            speaker_embeddings = self._resolve_speecht5_embedding(str(voice_ref_path))
+            # Placed like the zero embedding: on the model's device and dtype, once.
+            speaker_embeddings = self._resolve_speecht5_embedding(
+                str(voice_ref_path), like=zero_spk, owner=model_path
+            )
         else:
-            speaker_embeddings = torch.zeros((1, 512))  # neutral speaker embedding
-        speaker_embeddings = speaker_embeddings.to(model.device)
+            speaker_embeddings = zero_spk
 
-        with torch.inference_mode():
-            speech = model.generate_speech(
-                inputs["input_ids"],
-                speaker_embeddings,
-                vocoder=vocoder,
+        if BATCH_WINDOW_SECONDS > 0:
+            batcher = self._get_batcher(
+                model_path,
+                functools.partial(self._speecht5_generate_batch, processor, model, vocoder),
             )
-        if speed != 1.0:
-            # Simple resample by adjusting frame rate via numpy; keep it lightweight
-            speech = torch.nn.functional.interpolate(
-                speech.unsqueeze(0).unsqueeze(0),
-                scale_factor=1 / speed,
-                mode="linear",
-                align_corners=False,
-            ).squeeze()
-        waveform = speech.cpu().numpy()
-        duration = self._write_array_to_wav(waveform, processor.feature_extractor.sampling_rate, destination)
+            waveform = batcher.submit((text, speaker_embeddings))
+        else:
+            inputs = processor(text=text, return_tensors="pt")
+            if self.use_compile:
+                inputs = _pad_to_bucket(inputs, processor.tokenizer.pad_token_id)
+            inputs = _to_device(inputs, model.device)
+            with torch.inference_mode(), self._cpu_autocast():
+                speech = model.generate_speech(
+                    inputs["input_ids"],
+                    speaker_embeddings,
+                    attention_mask=inputs.get("attention_mask"),
+                    vocoder=vocoder,
+                )
+            waveform = speech.float().cpu().numpy()
+        # Speed is declared in the header (like the inference path), not resampled.
+        sampling_rate = int(processor.feature_extractor.sampling_rate * speed)
+        duration = self._write_array_to_wav(waveform, sampling_rate, destination)
         return AudioResult(
             job_id=job_id,
             audio_path=destination,
@@ -1030,6 +1917,29 @@ class TTSService:
             source="local",
         )
 
+    def _speecht5_generate_batch(
+        self, processor: Any, model: Any, vocoder: Any, items: List[Tuple[str, Any]]
+    ) -> List[Any]:
+        """Run one padded generate_speech() for several (text, speaker embedding) pairs."""
+        import torch
+
+        inputs = processor(text=[text for text, _ in items], return_tensors="pt", padding=True)
+        inputs = _to_device(inputs, model.device)
+        speakers = torch.cat([embedding.reshape(1, -1) for _, embedding in items])
+        with torch.inference_mode(), self._cpu_autocast():
+            speech, lengths = model.generate_speech(
+                inputs["input_ids"],
+                speakers,
+                attention_mask=inputs["attention_mask"],
+                vocoder=vocoder,
+                return_output_lengths=True,
+            )
+        speech = speech.float().cpu()
+        if speech.dim() == 1:  # a batch of one comes back unbatched
+            return [speech.numpy()]
+        # Waveforms are right-padded to the longest one: trim each to its own length.
+        return [speech[i, : lengths[i]].numpy() for i in range(len(items))]
+
     def _synthesize_mms_local(
         self,
         *,
@@ -1044,34 +1954,32 @@ class TTSService:
     ) -> AudioResult:
         try:
             import torch
-            import torch.nn.functional as F
-            from transformers import AutoProcessor, VitsModel
+            AutoProcessor, VitsModel = _vits_classes()
         except Exception as exc:  # noqa: BLE001
             raise RuntimeError("MMS local mode requires transformers and torch installed") from exc
 
-        if model_path not in self._local_pipelines:
-            processor = AutoProcessor.from_pretrained(model_path)
-            model = VitsModel.from_pretrained(model_path)
-            model.eval()
-            self._local_pipelines[model_path] = (processor, model)
-        processor, model = self._local_pipelines[model_path]
-
-        inputs = processor(text=text, return_tensors="pt")
-        with torch.inference_mode():
-            waveform = model(**inputs).waveform
-
-        if waveform.ndim == 2:  # (batch, time)
-            waveform = waveform.unsqueeze(1)
-        if speed != 1.0:
-            waveform = F.interpolate(
-                waveform,
-                scale_factor=1 / speed,
-                mode="linear",
-                align_corners=False,
-            )
-        waveform = waveform.squeeze().cpu().numpy()
-
-        sampling_rate = getattr(model.config, "sampling_rate", 16000)
+        with self._load_lock(model_path):
+            entry = self._local_pipelines.get(model_path)
+            if entry is None:
+                processor = AutoProcessor.from_pretrained(model_path)
+                model = VitsModel.from_pretrained(model_path, **self._load_kwargs())
+                model.eval()
+                entry = self._local_pipelines[model_path] = (processor, self._optimize_model(model))
+            processor, model = entry
+
+        model_rate = getattr(model.config, "sampling_rate", 16000)
+        sentences = _split_sentences(text)
+        if len(sentences) <= 1 or np is None:
+            waveform = self._mms_forward(processor, model, [text])[0]
+        else:
+            # Sentences go through padded forwards of at most MAX_BATCH each (memory is
+            # batch x longest sentence), then are joined with 5 ms crossfades.
+            segments: List[Any] = []
+            for start in range(0, len(sentences), MAX_BATCH):
+                chunk = sentences[start : start + MAX_BATCH]
+                segments += self._mms_forward(processor, model, chunk)
+            waveform = _crossfade_concat(segments, model_rate // 200)
+        sampling_rate = int(model_rate * speed)
         duration = self._write_array_to_wav(waveform, sampling_rate, destination)
         return AudioResult(
             job_id=job_id,
@@ -1084,27 +1992,68 @@ class TTSService:
             source="local",
         )
 
+    def _mms_forward(self, processor: Any, model: Any, texts: List[str]) -> List[Any]:
+        """One VITS forward over ``texts`` (padded when several); a waveform per text."""
+        import torch
+
+        batched = len(texts) > 1
+        inputs = processor(
+            text=texts if batched else texts[0], padding=batched, return_tensors="pt"
+        )
+        if self.use_compile:
+            inputs = _pad_to_bucket(inputs, processor.tokenizer.pad_token_id or 0)
+        inputs = _to_device(inputs, model.device)
+        with torch.inference_mode(), self._cpu_autocast():
+            outputs = model(**inputs)
+        if not batched:
+            return [outputs.waveform.squeeze().float().cpu().numpy()]
+        # Rows are zero-padded to the longest text: trim each to its own length.
+        rows = outputs.waveform.float().cpu().numpy()
+        return [row[:length] for row, length in zip(rows, outputs.sequence_lengths.tolist())]
+
     def _write_array_to_wav(self, audio_array, sample_rate: int, destination: Path) -> float:
-        try:
-            import numpy as np
-        except Exception as exc:  # noqa: BLE001
-            raise RuntimeError("Local pipeline requires numpy installed") from exc
+        if np is None:
+            raise RuntimeError("Local pipeline requires numpy installed")
 
-        destination.parent.mkdir(parents=True, exist_ok=True)
+        samples = np.asarray(audio_array, dtype=np.float32)
         # Ensure mono
-        if audio_array.ndim > 1:
-            audio_array = np.mean(audio_array, axis=1)
-        # Normalize to int16
-        max_val = np.max(np.abs(audio_array))
-        if max_val > 0:
-            audio_array = audio_array / max_val
-        int_data = (audio_array * 32767).astype(np.int16)
-
-        with wave.open(str(destination), "wb") as wav_out:
-            wav_out.setnchannels(1)
-            wav_out.setsampwidth(2)
-            wav_out.setframerate(sample_rate)
-            wav_out.writeframes(int_data.tobytes())
-
-        duration = len(int_data) / sample_rate
+        if samples.ndim > 1:
+            samples = samples.mean(axis=1, dtype=np.float32)
+        # Normalize to int16: peak from min/max (no abs() temporary), one scaling pass
+        peak = max(float(samples.max(initial=0.0)), -float(samples.min(initial=0.0)))
+        if not math.isfinite(peak):
+            # fp16 runs can overflow; casting NaN/inf to int16 is undefined, use silence.
+            samples = np.nan_to_num(samples, nan=0.0, posinf=0.0, neginf=0.0)
+            peak = max(float(samples.max(initial=0.0)), -float(samples.min(initial=0.0)))
+        scale = np.float32(32767.0 / peak if peak > 0 else 32767.0)
+        frame_count = len(samples)
+        block = _pcm_block()
+
+        def int16_blocks():
+            # Scale and cast one block at a time: long renders never hold a full-length
+            # scaled or int16 copy, and the caller's array is never modified.
+            for start in range(0, frame_count, _PCM_BLOCK):
+                chunk = samples[start : start + _PCM_BLOCK]
+                out = block[: len(chunk)]
+                np.multiply(chunk, scale, out=out, casting="unsafe")
+                yield out
+
+        if sf is not None:
+            with sf.SoundFile(
+                str(destination),
+                "w",
+                samplerate=sample_rate,
+                channels=1,
+                subtype="PCM_16",
+                format="WAV",
+            ) as fh:
+                for out in int16_blocks():
+                    fh.write(out)
+        else:
+            with destination.open("wb") as fh:
+                fh.write(_wav_header(frame_count * 2, sample_rate))
+                for out in int16_blocks():
+                    fh.write(out)
+
+        duration = frame_count / sample_rate
         return duration
@@ -11,11 +11,13 @@ Examples:
 from __future__ import annotations
 
 import argparse
+import importlib.util
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Iterable, List
 
-from huggingface_hub import snapshot_download
+from huggingface_hub import HfApi, snapshot_download
 
 DEFAULT_MODELS = {
     "kokoro": "hexgrad/Kokoro-82M",
@@ -31,6 +33,8 @@ EXTRA_MODELS = {
     "cosyvoice3": "FunAudioLLM/Fun-CosyVoice3-0.5B-2512",
 }
 MODEL_ALIASES = {**DEFAULT_MODELS, **EXTRA_MODELS}
+# Weights in formats the torch backends never load (TensorFlow, Flax, Rust).
+FOREIGN_WEIGHTS = ["*.msgpack", "*.h5", "*.ot", "tf_model*", "flax_model*", "rust_model*"]
 
 
 def resolve_repo_ids(models: Iterable[str]) -> List[str]:
@@ -40,6 +44,19 @@ def resolve_repo_ids(models: Iterable[str]) -> List[str]:
     return repo_ids
 
 
+def ignore_patterns(repo_id: str, token: str | None) -> List[str]:
+    """Skip other frameworks' weights, and the .bin checkpoint when safetensors ship too."""
+    patterns = list(FOREIGN_WEIGHTS)
+    try:
+        files = set(HfApi(token=token).list_repo_files(repo_id))
+    except Exception:  # noqa: BLE001 - listing is an optimization, download anyway
+        return patterns
+    if files & {"model.safetensors", "model.safetensors.index.json"}:
+        # transformers loads safetensors first: the duplicate .bin is GBs never read.
+        patterns.append("pytorch_model*.bin")
+    return patterns
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Telecharge les modeles TTS necessaires en local.")
     parser.add_argument(
@@ -65,7 +82,11 @@ def main() -> None:
     repo_ids = resolve_repo_ids(args.models)
 
     dest.mkdir(parents=True, exist_ok=True)
-    for repo_id in repo_ids:
+    if importlib.util.find_spec("hf_transfer") is not None:
+        # Rust downloader for large shards; only when installed (the hub errors otherwise).
+        os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+    def download(repo_id: str) -> str:
         target = dest / repo_id.replace("/", "_")
         print(f"--> Downloading {repo_id} to {target}")
         snapshot_download(
@@ -73,7 +94,16 @@ def main() -> None:
             local_dir=target,
             local_dir_use_symlinks=False,
             token=token,
+            max_workers=8,
+            ignore_patterns=ignore_patterns(repo_id, token),
         )
+        return repo_id
+
+    # Repos are independent: overlap them instead of waiting on each in turn.
+    with ThreadPoolExecutor(max_workers=max(1, min(4, len(repo_ids)))) as pool:
+        futures = [pool.submit(download, repo_id) for repo_id in dict.fromkeys(repo_ids)]
+        for future in as_completed(futures):
+            print(f"<-- {future.result()} ok")
     print("Done.")
 
 